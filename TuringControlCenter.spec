@@ -10,6 +10,7 @@ a = Analysis(
         ('config.py', '.'),
         ('device_manager.py', '.'),
         ('monitor.py', '.'),
+        ('pacing.py', '.'),
         ('renderer.py', '.'),
         ('widgets.py', '.'),
     ],
@@ -17,13 +18,15 @@ a = Analysis(
         'PIL._tkinter_finder',
         'serial.tools.list_ports',
         'psutil',
-        'GPUtil',
+        'pynvml',
+        'orjson',
         'pystray',
         'pystray._win32',
         'six',
         'config',
         'device_manager',
         'monitor',
+        'pacing',
         'renderer',
         'widgets',
     ],
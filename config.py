@@ -21,6 +21,11 @@ BAUD_RATE = 115200
 # How often to refresh the display (milliseconds)
 UPDATE_INTERVAL_MS = 500
 
+# Back off after failed display writes: the delay doubles per consecutive
+# failure starting from the base, up to the max (seconds)
+WRITE_RETRY_BASE_BACKOFF = 0.1
+WRITE_RETRY_MAX_BACKOFF = 5.0
+
 # === Layout Configuration ===
 # Path to the layout JSON file
 DEFAULT_LAYOUT = "layouts/default.json"
@@ -29,6 +34,12 @@ DEFAULT_LAYOUT = "layouts/default.json"
 # Enable verbose logging
 DEBUG = False
 
+# Print smoothed collect/render/display times every N frames (0 to disable)
+TIMING_LOG_FRAMES = 30
+
+# Smoothing factor for the frame timing averages (lower = smoother)
+TIMING_EWMA_ALPHA = 0.1
+
 # Save rendered images to disk for debugging
 SAVE_DEBUG_IMAGES = False
 DEBUG_IMAGE_PATH = "debug_output.png"
@@ -54,5 +65,9 @@ INCREMENTAL_RENDERING = True
 # happens periodically to ensure the display stays perfectly synchronized
 FULL_RENDER_INTERVAL = 300  # 5 minutes
 
+# Full-frame mode: send only the changed rectangle when it covers at most
+# this fraction of the screen, otherwise send the whole frame
+PARTIAL_UPDATE_MAX_RATIO = 0.5
+
 # Log incremental rendering stats (region count, pixel totals)
 DEBUG_INCREMENTAL = True
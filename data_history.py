@@ -5,6 +5,7 @@ Stores recent data points using circular buffers
 
 import threading
 from collections import deque
+from itertools import islice
 import time
 
 
@@ -19,6 +20,7 @@ class DataHistory:
             max_points: Maximum data points to store per metric
         """
         self.histories = {}  # metric_name -> deque of values
+        self.subscribed = set()  # Metrics read by get_history() at least once
         self.max_points = max_points
         self.lock = threading.Lock()
 
@@ -37,10 +39,34 @@ class DataHistory:
 
             self.histories[metric_name].append(float(value))
 
+    def add_data_points(self, points):
+        """
+        Add data points for many metrics under a single lock (thread-safe)
+
+        Only metrics that have been read with get_history() are recorded,
+        so history is not kept for metrics no sparkline shows.
+
+        Args:
+            points: Iterable of (metric_name, value) pairs
+        """
+        with self.lock:
+            histories = self.histories
+            subscribed = self.subscribed
+            for metric_name, value in points:
+                if metric_name not in subscribed:
+                    continue
+                history = histories.get(metric_name)
+                if history is None:
+                    # Create new deque with max length for automatic eviction
+                    history = histories[metric_name] = deque(maxlen=self.max_points)
+                history.append(float(value))
+
     def get_history(self, metric_name, num_points=None):
         """
         Get recent history for metric (thread-safe)
 
+        Subscribes the metric, so add_data_points() records it from now on.
+
         Args:
             metric_name: Name of metric
             num_points: Number of recent points to return (None = all)
@@ -49,17 +75,19 @@ class DataHistory:
             list: List of values (empty if metric not found)
         """
         with self.lock:
-            if metric_name not in self.histories:
+            self.subscribed.add(metric_name)
+            history = self.histories.get(metric_name)
+            if history is None:
                 return []
 
-            values = list(self.histories[metric_name])
-
-            if num_points:
-                return values[-num_points:]
-            return values
+            # Copy only the requested tail of the ring buffer
+            skip = len(history) - num_points if num_points else 0
+            if skip > 0:
+                return list(islice(history, skip, None))
+            return list(history)
 
     def clear(self):
-        """Clear all historical data"""
+        """Clear all historical data (subscriptions are kept)"""
         with self.lock:
             self.histories.clear()
 
@@ -10,7 +10,7 @@ import serial.tools.list_ports
 import time
 import struct
 import threading
-from PIL import Image
+from PIL import Image, ImageChops
 import config as cfg
 
 
@@ -44,6 +44,7 @@ class TuringDisplay:
         self.width = cfg.DISPLAY_WIDTH
         self.height = cfg.DISPLAY_HEIGHT
         self.lock = threading.Lock()  # Thread safety for serial access
+        self.last_frame = None  # Last full frame known to be on screen (for diffing)
 
     def connect(self):
         """
@@ -268,6 +269,8 @@ class TuringDisplay:
                 if cfg.DEBUG:
                     print(f"Sent {len(rgb565_data) + 6} bytes to display")
 
+                self.last_frame = image
+
                 # Save debug image if enabled
                 if cfg.SAVE_DEBUG_IMAGES:
                     image.save(cfg.DEBUG_IMAGE_PATH)
@@ -328,6 +331,9 @@ class TuringDisplay:
                 self.serial.write(rgb565_data)
                 self.serial.flush()
 
+                # Screen no longer matches a known full frame
+                self.last_frame = None
+
                 if cfg.DEBUG:
                     print(f"Partial update: ({x},{y}) {width}x{height} = {len(rgb565_data)} bytes")
 
@@ -336,6 +342,38 @@ class TuringDisplay:
             print(f"Error displaying partial image: {e}")
             return False
 
+    def display_changed_region(self, image):
+        """
+        Display a full frame, sending only the part that changed on screen.
+
+        Diffs against the last full frame displayed and skips the transfer
+        if nothing changed, sends the changed rectangle if it covers at most
+        PARTIAL_UPDATE_MAX_RATIO of the screen, otherwise sends the frame.
+
+        Args:
+            image: PIL Image (should be 320x480)
+
+        Returns:
+            bool: Success status
+        """
+        previous = self.last_frame
+        bbox = None
+
+        if previous is not None and previous.size == image.size:
+            # Exact pixel diff, runs in C
+            bbox = ImageChops.difference(previous, image).getbbox()
+            if bbox is None:
+                return True
+
+            x0, y0, x1, y1 = bbox
+            if (x1 - x0) * (y1 - y0) <= self.width * self.height * cfg.PARTIAL_UPDATE_MAX_RATIO:
+                if self.display_partial_image(image.crop(bbox), x0, y0):
+                    self.last_frame = image
+                    return True
+
+        # Fall back to a full blit if the region was too large or rejected
+        return self.display_image(image)
+
     def display_dirty_regions(self, dirty_regions):
         """
         Display multiple dirty regions from incremental rendering.
@@ -369,6 +407,7 @@ class TuringDisplay:
         Returns:
             bool: True if cleared successfully
         """
+        self.last_frame = None
         return self._send_command(Commands.CLEAR)
 
     def set_brightness(self, level):
@@ -403,6 +442,127 @@ class TuringDisplay:
             return False
 
 
+class DisplayWriter:
+    """Writes frames to the display on a background thread"""
+
+    def __init__(self, display):
+        """
+        Initialize display writer
+
+        Args:
+            display: Connected TuringDisplay instance
+        """
+        self.display = display
+        self.pending = None  # (kind, payload) waiting to be written
+        self.condition = threading.Condition()
+        self.write_thread = None
+        self.running = False
+        self.last_success = True  # Result of the most recent write
+        self.frames_dropped = 0  # Frames replaced before they were written
+        self.write_time = 0.0  # Duration of the most recent write (seconds)
+        self.fail_streak = 0  # Consecutive failed writes
+        self.retry_at = 0.0  # perf_counter time when writes resume after a failure
+
+    def start(self):
+        """Start background write thread"""
+        if self.running:
+            return
+
+        self.running = True
+        self.write_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self.write_thread.start()
+
+    def stop(self):
+        """Stop background write thread after the in-flight write finishes"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.write_thread:
+            self.write_thread.join(timeout=5.0)
+
+    def submit_frame(self, image):
+        """
+        Queue a full frame, replacing any frame not yet written (never blocks)
+
+        Args:
+            image: PIL Image to display
+        """
+        with self.condition:
+            if self.pending is not None:
+                self.frames_dropped += 1
+            self.pending = ('frame', image)
+            self.condition.notify_all()
+
+    def submit_regions(self, dirty_regions):
+        """
+        Queue dirty regions, waiting for any unwritten submission first.
+
+        Regions are deltas and cannot be coalesced, so this applies
+        backpressure instead of dropping.
+
+        Args:
+            dirty_regions: List from Renderer.render_incremental()
+        """
+        with self.condition:
+            while self.pending is not None and self.running:
+                self.condition.wait()
+            self.pending = ('regions', dirty_regions)
+            self.condition.notify_all()
+
+    def is_backing_off(self):
+        """Check if writes are paused after consecutive failures"""
+        return self.fail_streak > 0 and time.perf_counter() < self.retry_at
+
+    def _write_loop(self):
+        """Main write loop (runs in background thread)"""
+        try:
+            self._run_writes()
+        finally:
+            # Never leave producers waiting on a dead thread
+            with self.condition:
+                self.running = False
+                self.condition.notify_all()
+
+    def _run_writes(self):
+        """Write submitted frames until stopped"""
+        while True:
+            with self.condition:
+                while self.pending is None and self.running:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                kind, payload = self.pending
+                self.pending = None
+                self.condition.notify_all()
+
+            start = time.perf_counter()
+            try:
+                if kind == 'frame':
+                    self.last_success = self.display.display_changed_region(payload)
+                else:
+                    self.last_success = self.display.display_dirty_regions(payload)
+            except Exception as e:
+                # E.g. frame size/mode changed after a layout switch - count
+                # it as a failed write instead of killing the writer thread
+                print(f"Error writing to display: {e}")
+                self.last_success = False
+            self.write_time = time.perf_counter() - start
+
+            if self.last_success:
+                self.fail_streak = 0
+                continue
+
+            # Back off exponentially instead of hammering an unhealthy USB link
+            self.fail_streak += 1
+            backoff = min(cfg.WRITE_RETRY_MAX_BACKOFF,
+                          cfg.WRITE_RETRY_BASE_BACKOFF * 2 ** (self.fail_streak - 1))
+            self.retry_at = time.perf_counter() + backoff
+            if cfg.DEBUG:
+                print(f"Write failed {self.fail_streak} times in a row, retrying in {backoff:.1f}s")
+            with self.condition:
+                self.condition.wait_for(lambda: not self.running, timeout=backoff)
+
+
 # For testing
 if __name__ == "__main__":
     print("Testing Device Manager with Protocol Implementation...")
@@ -15,6 +15,7 @@ class ExternalDataManager:
 
     def __init__(self):
         self.data = {}  # Cached data
+        self.numeric_data = {}  # Numeric entries of data, rebuilt on each update
         self.lock = threading.Lock()
         self.fetch_thread = None
         self.running = False
@@ -24,6 +25,8 @@ class ExternalDataManager:
             'crypto': {'enabled': False, 'symbols': [], 'interval': 60}
         }
         self.last_fetch_times = {}
+        # Reused across fetches so HTTPS connections are kept alive
+        self.session = requests.Session()
 
     def configure(self, config):
         """Update configuration"""
@@ -55,33 +58,50 @@ class ExternalDataManager:
         with self.lock:
             return self.data.copy()
 
+    def get_numeric_data(self):
+        """Get the numeric entries of the cached data (read-only, never blocks)"""
+        with self.lock:
+            return self.numeric_data
+
+    def _update_data(self, values):
+        """
+        Merge fetched values into the cache (caller must hold the lock)
+
+        Args:
+            values: Dictionary of data keys to fetched values
+        """
+        self.data.update(values)
+        # Replace rather than mutate - readers may still hold the old dict
+        self.numeric_data = {key: value for key, value in self.data.items()
+                             if isinstance(value, (int, float))}
+
     def _fetch_loop(self):
         """Main fetch loop (runs in background thread)"""
         while self.running:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # Fetch weather if enabled and interval elapsed
                 if self.config['weather']['enabled']:
                     interval = self.config['weather']['interval']
-                    last_fetch = self.last_fetch_times.get('weather', 0)
-                    if current_time - last_fetch >= interval:
+                    last_fetch = self.last_fetch_times.get('weather')
+                    if last_fetch is None or current_time - last_fetch >= interval:
                         self._fetch_weather()
                         self.last_fetch_times['weather'] = current_time
 
                 # Fetch stocks if enabled
                 if self.config['stocks']['enabled']:
                     interval = self.config['stocks']['interval']
-                    last_fetch = self.last_fetch_times.get('stocks', 0)
-                    if current_time - last_fetch >= interval:
+                    last_fetch = self.last_fetch_times.get('stocks')
+                    if last_fetch is None or current_time - last_fetch >= interval:
                         self._fetch_stocks()
                         self.last_fetch_times['stocks'] = current_time
 
                 # Fetch crypto if enabled
                 if self.config['crypto']['enabled']:
                     interval = self.config['crypto']['interval']
-                    last_fetch = self.last_fetch_times.get('crypto', 0)
-                    if current_time - last_fetch >= interval:
+                    last_fetch = self.last_fetch_times.get('crypto')
+                    if last_fetch is None or current_time - last_fetch >= interval:
                         self._fetch_crypto()
                         self.last_fetch_times['crypto'] = current_time
 
@@ -97,18 +117,20 @@ class ExternalDataManager:
             location = self.config['weather']['location']
             url = f"https://wttr.in/{location}?format=j1"
 
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
             data = response.json()
 
             current = data['current_condition'][0]
 
             with self.lock:
-                self.data['weather_temp'] = current['temp_C']
-                self.data['weather_temp_f'] = current['temp_F']
-                self.data['weather_condition'] = current['weatherDesc'][0]['value']
-                self.data['weather_humidity'] = current['humidity']
-                self.data['weather_wind_speed'] = current['windspeedKmph']
+                self._update_data({
+                    'weather_temp': current['temp_C'],
+                    'weather_temp_f': current['temp_F'],
+                    'weather_condition': current['weatherDesc'][0]['value'],
+                    'weather_humidity': current['humidity'],
+                    'weather_wind_speed': current['windspeedKmph']
+                })
 
             logging.info(f"Weather data fetched: {current['temp_C']}°C, {current['weatherDesc'][0]['value']}")
 
@@ -131,8 +153,10 @@ class ExternalDataManager:
                     info = stock.info
 
                     with self.lock:
-                        self.data[f'stock_{ticker}_price'] = info.get('currentPrice', info.get('regularMarketPrice', 0))
-                        self.data[f'stock_{ticker}_change'] = info.get('regularMarketChange', 0)
+                        self._update_data({
+                            f'stock_{ticker}_price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
+                            f'stock_{ticker}_change': info.get('regularMarketChange', 0)
+                        })
 
                     logging.info(f"Stock {ticker} fetched: ${info.get('currentPrice', info.get('regularMarketPrice', 0))}")
 
@@ -142,7 +166,7 @@ class ExternalDataManager:
         except ImportError:
             logging.warning("yfinance not installed - stock tracking unavailable")
             with self.lock:
-                self.data['stock_error'] = 'yfinance not installed'
+                self._update_data({'stock_error': 'yfinance not installed'})
 
     def _fetch_crypto(self):
         """Fetch crypto prices from CoinGecko (no API key required)"""
@@ -155,17 +179,20 @@ class ExternalDataManager:
             ids = ','.join([s.lower() for s in symbols])
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd&include_24hr_change=true"
 
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
             data = response.json()
 
+            values = {}
+            for symbol in symbols:
+                symbol_lower = symbol.lower()
+                if symbol_lower in data:
+                    values[f'crypto_{symbol}_price'] = data[symbol_lower]['usd']
+                    values[f'crypto_{symbol}_change_24h'] = data[symbol_lower].get('usd_24h_change', 0)
+                    logging.info(f"Crypto {symbol} fetched: ${data[symbol_lower]['usd']}")
+
             with self.lock:
-                for symbol in symbols:
-                    symbol_lower = symbol.lower()
-                    if symbol_lower in data:
-                        self.data[f'crypto_{symbol}_price'] = data[symbol_lower]['usd']
-                        self.data[f'crypto_{symbol}_change_24h'] = data[symbol_lower].get('usd_24h_change', 0)
-                        logging.info(f"Crypto {symbol} fetched: ${data[symbol_lower]['usd']}")
+                self._update_data(values)
 
         except Exception as e:
             logging.error(f"Crypto fetch error: {e}")
@@ -21,6 +21,7 @@ try:
     from device_manager import TuringDisplay
     from monitor import get_all_metrics
     from renderer import Renderer
+    from pacing import FramePacer
     import widgets
     import config as cfg
     import serial.tools.list_ports
@@ -34,6 +35,7 @@ except Exception as e:
     TuringDisplay = None
     get_all_metrics = None
     Renderer = None
+    FramePacer = None
     widgets = None
 
 # Load user settings from JSON if available
@@ -717,9 +719,12 @@ class TuringControlCenter:
             last_full_render = 0  # Track last full render for periodic refresh
             self.log(f"Incremental rendering: {'Enabled' if cfg.INCREMENTAL_RENDERING else 'Disabled'}")
 
+            # Deadline-based pacing on a monotonic clock
+            pacer = FramePacer(cfg.UPDATE_INTERVAL_MS / 1000.0)
+
             while self.is_running:
                 try:
-                    loop_start = time.time()
+                    loop_start = time.perf_counter()
 
                     # Get metrics
                     data = get_all_metrics()
@@ -731,13 +736,13 @@ class TuringControlCenter:
 
                     if cfg.INCREMENTAL_RENDERING:
                         # Incremental rendering - only update changed regions
-                        force_full = (time.time() - last_full_render) > cfg.FULL_RENDER_INTERVAL
+                        force_full = (time.perf_counter() - last_full_render) > cfg.FULL_RENDER_INTERVAL
                         dirty_regions = self.renderer.render_incremental(data, force_full=force_full)
                         success = self.display.display_dirty_regions(dirty_regions)
 
                         # Track full render time
                         if force_full or (len(dirty_regions) == 1 and dirty_regions[0]['x'] == 0):
-                            last_full_render = time.time()
+                            last_full_render = time.perf_counter()
 
                         # Debug logging for incremental mode
                         if cfg.DEBUG_INCREMENTAL and frame_count % 10 == 0:
@@ -748,18 +753,16 @@ class TuringControlCenter:
                         image = self.renderer.render(data)
                         success = self.display.display_image(image)
 
-                    # Calculate loop time and adjust sleep
-                    loop_time = (time.time() - loop_start) * 1000  # Convert to ms
+                    # Calculate loop time for logging
+                    loop_time = (time.perf_counter() - loop_start) * 1000  # Convert to ms
 
                     if frame_count % 10 == 0:
                         self.log(f"Frame {frame_count}: Display update {'OK' if success else 'FAIL'} (took {loop_time:.0f}ms)")
 
                     frame_count += 1
 
-                    # Sleep for remaining time to maintain target interval
-                    sleep_time = max(0, (cfg.UPDATE_INTERVAL_MS - loop_time) / 1000.0)
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+                    # Sleep until the next frame deadline
+                    pacer.wait()
                 except Exception as e:
                     self.log(f"Error in monitor loop: {e}")
                     import traceback
@@ -1684,6 +1687,12 @@ class WidgetDialog:
         else:
             self.existing_widget = None
 
+        # Reusable full-size preview buffer (cleared each render, not reallocated)
+        self._preview_buf = Image.new('RGB', (320, 480), color='black')
+
+        # Widget type the type-specific form was last built for
+        self._current_type = None
+
         self.create_widgets()
 
         # Wait for dialog to close
@@ -1709,6 +1718,9 @@ class WidgetDialog:
         self.preview_canvas = tk.Canvas(right_frame, width=160, height=240, bg='black', highlightthickness=1, highlightbackground='gray')
         self.preview_canvas.pack()
 
+        # Error overlay shown over the preview (placed only while there is an error)
+        self._error_label = ttk.Label(self.preview_canvas, text='', foreground='red', font=('Arial', 9), wraplength=150)
+
         # Scrollable canvas for form (left side)
         canvas = tk.Canvas(left_frame)
         scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=canvas.yview)
@@ -1859,19 +1871,33 @@ class WidgetDialog:
         if self.mode == 'edit':
             ttk.Button(button_frame, text="Delete Widget", command=self.on_delete).pack(side='left', padx=20)
 
+        # Re-render a preview that was skipped while the dialog was hidden
+        self._preview_dirty = False
+        self.dialog.bind('<Map>', self.on_dialog_map)
+
         # Initial preview render
         self.dialog.after(100, self.update_preview)
 
+    def on_dialog_map(self, event):
+        """Catch up on preview updates skipped while the dialog was unmapped"""
+        # Toplevel bindings also fire for child widgets - only react to the dialog itself
+        if event.widget is self.dialog and self._preview_dirty:
+            self.update_preview()
+
     def update_preview(self):
         """Update the widget preview"""
+        # Rendering an invisible preview is wasted work - defer until mapped
+        if not self.dialog.winfo_viewable():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
+
         try:
             # Create a temporary widget config from current form values
             widget_config = self.build_widget_config()
 
             if not widget_config:
-                # Show error message on canvas
-                self.preview_canvas.delete('all')
-                self.preview_canvas.create_text(80, 120, text="Invalid config", fill='red', font=('Arial', 10))
+                self.show_preview_error("Invalid config")
                 return
 
             # Import required modules
@@ -1942,16 +1968,13 @@ class WidgetDialog:
             
             widget = self._cached_widget
 
-            # Create a preview image (320x480)
-            preview_img = Image.new('RGB', (320, 480), color='black')
-
-            # Get background from layout if available
-            if 'background_color' in self.layout.get('display', {}):
-                bg_color = self.layout['display']['background_color']
-                preview_img = Image.new('RGB', (320, 480), color=bg_color)
+            # Reuse the preview buffer, clearing it to the layout background
+            preview_img = self._preview_buf
+            bg_color = self.layout.get('display', {}).get('background_color', 'black')
 
             # Create ImageDraw object for rendering
             draw = ImageDraw.Draw(preview_img)
+            draw.rectangle([(0, 0), preview_img.size], fill=bg_color)
 
             # Get sample data for preview (need to pass all data as dict)
             data = {widget_config['data_source']: self.get_sample_data(widget_config['data_source'])}
@@ -1964,11 +1987,16 @@ class WidgetDialog:
             self.preview_photo = ImageTk.PhotoImage(preview_img)
             self.preview_canvas.delete('all')
             self.preview_canvas.create_image(0, 0, anchor='nw', image=self.preview_photo)
+            self._error_label.place_forget()
 
         except Exception as e:
-            # Show error on canvas for debugging
-            self.preview_canvas.delete('all')
-            self.preview_canvas.create_text(80, 120, text=f"Error:\n{str(e)[:50]}", fill='red', font=('Arial', 9), width=150)
+            # Show error over the preview for debugging
+            self.show_preview_error(f"Error:\n{str(e)[:50]}")
+
+    def show_preview_error(self, message):
+        """Show an error message over the preview canvas"""
+        self._error_label.config(text=message)
+        self._error_label.place(relx=0.5, rely=0.5, anchor='center')
 
     def get_sample_data(self, data_source):
         """Get sample data for preview"""
@@ -2148,7 +2176,6 @@ class WidgetDialog:
                     
                     # Parse color zones from JSON text
                     try:
-                        import json
                         zones_text = self.gauge_color_zones_var.get('1.0', 'end-1c')
                         config['color_zones'] = json.loads(zones_text)
                     except:
@@ -2186,12 +2213,17 @@ class WidgetDialog:
 
     def on_type_change(self, event=None):
         """Update UI based on widget type"""
+        widget_type = self.type_var.get()
+
+        # Re-selecting the same type would rebuild an identical form
+        if widget_type == self._current_type:
+            return
+        self._current_type = widget_type
+
         # Clear specific frame
         for widget in self.specific_frame.winfo_children():
             widget.destroy()
 
-        widget_type = self.type_var.get()
-
         # Update default update_interval based on type
         if hasattr(self, 'update_interval_var'):
             if widget_type == 'image':
@@ -2648,7 +2680,6 @@ class WidgetDialog:
         zones_frame.grid(row=row, column=0, columnspan=2, sticky='w', pady=5)
         
         # Get existing zones or use default
-        import json
         default_zones = self.existing_widget.get('color_zones', [
             {'range': [0, 60], 'color': '#00FF00'},
             {'range': [60, 85], 'color': '#FFAA00'},
@@ -2843,7 +2874,6 @@ class WidgetDialog:
             config['value_format'] = self.gauge_value_format_var.get()
             
             # Parse color zones from JSON text
-            import json
             zones_text = self.gauge_color_zones_var.get('1.0', 'end-1c')
             try:
                 config['color_zones'] = json.loads(zones_text)
@@ -13,6 +13,7 @@ import config as cfg
 import monitor
 import renderer
 import device_manager
+from pacing import FramePacer
 
 
 def parse_args():
@@ -67,6 +68,7 @@ def main():
     if args.test_render:
         print("\nTest render mode - no display connection")
         print("Rendering test image...")
+        monitor.wait_for_cpu_name(timeout=5)
         data = monitor.get_all_metrics()
         image = rend.render(data)
         image.save("test_render.png")
@@ -101,47 +103,93 @@ def main():
     # Main rendering loop
     frame_count = 0
     last_full_render = 0  # Track last full render for periodic refresh
-    try:
-        while True:
-            loop_start = time.time()
+    last_fingerprint = None  # Displayed values of the last full-frame render
+
+    # Write frames on a background thread so USB I/O overlaps the next render
+    writer = device_manager.DisplayWriter(display)
+    writer.start()
+
+    # Collect metrics in the background; the loop always reads the freshest snapshot
+    collector = monitor.MetricsCollector(interval=cfg.UPDATE_INTERVAL_MS / 2000.0)
+    collector.start()
 
-            # Collect system metrics
-            data = monitor.get_all_metrics()
+    # Smoothed per-stage frame times (seconds), cheap enough to keep always on
+    ewma_collect = ewma_render = ewma_io = ewma_wait = 0.0
+    alpha = cfg.TIMING_EWMA_ALPHA
 
-            if cfg.INCREMENTAL_RENDERING:
+    # Deadline-based pacing on a monotonic clock
+    pacer = FramePacer(cfg.UPDATE_INTERVAL_MS / 1000.0)
+    try:
+        while True:
+            # Latest system metrics (collected on the background thread)
+            data = collector.get_latest()
+
+            render_start = time.perf_counter()
+            submit_wait = 0.0  # Time blocked on writer backpressure (not rendering)
+            if writer.is_backing_off():
+                # Display writes are failing - don't render frames that can't be sent
+                pass
+            elif cfg.INCREMENTAL_RENDERING:
                 # Incremental rendering - only update changed regions
-                force_full = (time.time() - last_full_render) > cfg.FULL_RENDER_INTERVAL
+                # (full redraw while recovering from failed writes)
+                force_full = ((time.perf_counter() - last_full_render) > cfg.FULL_RENDER_INTERVAL or
+                              writer.fail_streak > 0)
                 dirty_regions = rend.render_incremental(data, force_full=force_full)
-                success = display.display_dirty_regions(dirty_regions)
+                submit_start = time.perf_counter()
+                writer.submit_regions(dirty_regions)
+                submit_wait = time.perf_counter() - submit_start
 
                 # Track full render time
                 if force_full or (len(dirty_regions) == 1 and dirty_regions[0]['x'] == 0):
-                    last_full_render = time.time()
+                    last_full_render = time.perf_counter()
 
                 # Debug logging for incremental mode
                 if cfg.DEBUG_INCREMENTAL:
                     total_px = sum(r['width'] * r['height'] for r in dirty_regions)
                     print(f"Incremental: {len(dirty_regions)} regions, {total_px} pixels")
             else:
-                # Full frame rendering
-                image = rend.render(data)
-                success = display.display_image(image)
+                # Full frame rendering - skipped entirely when no displayed value
+                # changed (still refreshed every FULL_RENDER_INTERVAL)
+                fingerprint = rend.data_fingerprint(data)
+                if (fingerprint != last_fingerprint or writer.fail_streak > 0 or
+                        (time.perf_counter() - last_full_render) > cfg.FULL_RENDER_INTERVAL):
+                    # The writer sends only what changed and replaces a frame
+                    # still waiting behind a slow write
+                    image = rend.render(data)
+                    writer.submit_frame(image)
+                    last_fingerprint = fingerprint
+                    last_full_render = time.perf_counter()
+
+            # Update stage timings (collection and writes run on their own threads)
+            ewma_render += alpha * ((time.perf_counter() - render_start - submit_wait) - ewma_render)
+            ewma_wait += alpha * (submit_wait - ewma_wait)
+            ewma_collect += alpha * (collector.collect_time - ewma_collect)
+            ewma_io += alpha * (writer.write_time - ewma_io)
 
             # Log progress
             frame_count += 1
             if cfg.DEBUG or frame_count % 10 == 0:
                 timestamp = datetime.now().strftime("%H:%M:%S")
-                status = "[OK]" if success else "[FAIL]"
+                status = "[OK]" if writer.last_success else "[FAIL]"
                 print(f"[{timestamp}] Frame {frame_count}: CPU={data['cpu_percent']:.1f}% RAM={data['ram_percent']:.1f}% {status}")
 
-            # Sleep for remaining time in update interval
-            loop_time = (time.time() - loop_start) * 1000  # Convert to ms
-            sleep_time = max(0, (cfg.UPDATE_INTERVAL_MS - loop_time) / 1000)
-            time.sleep(sleep_time)
+            # Log frame time budget
+            if cfg.TIMING_LOG_FRAMES and frame_count % cfg.TIMING_LOG_FRAMES == 0:
+                # Stages overlap, so the slowest one bounds the frame rate
+                slowest = max(ewma_collect, ewma_render, ewma_io)
+                budget = "" if slowest <= pacer.period else " [OVER BUDGET]"
+                print(f"Timing: collect={ewma_collect * 1000:.1f}ms render={ewma_render * 1000:.1f}ms "
+                      f"display={ewma_io * 1000:.1f}ms wait={ewma_wait * 1000:.1f}ms "
+                      f"(budget {pacer.period * 1000:.0f}ms){budget}")
+
+            # Sleep until the next frame deadline
+            pacer.wait()
 
     except KeyboardInterrupt:
         print("\n" + "-" * 70)
         print("\nShutting down...")
+        collector.stop()
+        writer.stop()
         display.disconnect()
         print(f"Total frames rendered: {frame_count}")
         print("Goodbye!")
@@ -149,6 +197,8 @@ def main():
 
     except Exception as e:
         print(f"\nError in main loop: {e}")
+        collector.stop()
+        writer.stop()
         display.disconnect()
         return 1
 
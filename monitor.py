@@ -4,15 +4,107 @@ Collects system metrics using psutil
 """
 
 import psutil
-from datetime import datetime
+import atexit
+import os
+import sys
 import socket
 import platform
 import time
-import urllib.request
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import http.client
 import json
+import re
+from collections import namedtuple
+from types import MappingProxyType
 from data_history import DataHistory
 from external_data import ExternalDataManager
 
+try:
+    import pynvml  # NVIDIA only - GPU fallback when LibreHardwareMonitor is not running
+except ImportError:
+    pynvml = None
+
+try:
+    import orjson  # Optional - faster parsing of the LibreHardwareMonitor payload
+except ImportError:
+    orjson = None
+
+# Both parsers accept the raw UTF-8 response bytes (no decode step)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# WMI (Windows only) is imported on first use - importing it initializes COM
+_wmi = None
+_pythoncom = None
+_wmi_checked = False
+
+
+def _get_wmi():
+    """
+    Import the wmi module once, on first use
+
+    Returns:
+        module or None: The wmi module, or None if it is not installed
+    """
+    global _wmi, _pythoncom, _wmi_checked
+
+    if not _wmi_checked:
+        _wmi_checked = True
+        try:
+            import wmi
+            import pythoncom  # Installed with wmi (pywin32)
+            _wmi = wmi
+            _pythoncom = pythoncom
+        except ImportError:
+            _wmi = None
+    return _wmi
+
+
+# WMI connections by (thread, namespace) - connecting is slow, and COM
+# objects must be used on the thread that created them
+_wmi_connections = {}
+
+# Failed connects by (thread, namespace) -> time.monotonic() of the failure.
+# A missing namespace (OpenHardwareMonitor not installed) fails slowly, so
+# it is only retried after _WMI_RETRY_INTERVAL seconds
+_wmi_connect_failures = {}
+_WMI_RETRY_INTERVAL = 300
+
+
+def _get_wmi_connection(namespace="root\\cimv2"):
+    """
+    Get a reusable WMI connection for the calling thread
+
+    Args:
+        namespace: WMI namespace to connect to
+
+    Returns:
+        WMI connection, or None if the wmi module is not installed or the
+        namespace cannot be reached
+    """
+    wmi = _get_wmi()
+    if wmi is None:
+        return None
+
+    key = (threading.get_ident(), namespace)
+    connection = _wmi_connections.get(key)
+    if connection is None:
+        failed_at = _wmi_connect_failures.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < _WMI_RETRY_INTERVAL:
+            return None
+        try:
+            # COM must be initialized on every thread that uses it
+            _pythoncom.CoInitialize()
+            connection = wmi.WMI(namespace=namespace)
+        except Exception:
+            # COM/WMI errors (namespace not registered, access denied)
+            _wmi_connect_failures[key] = time.monotonic()
+            return None
+        _wmi_connections[key] = connection
+        _wmi_connect_failures.pop(key, None)
+    return connection
+
 
 # ============== LibreHardwareMonitor Cache ==============
 # Cache LHM data to avoid multiple HTTP requests per update cycle
@@ -21,83 +113,243 @@ _lhm_cache_time = 0
 _lhm_cache_ttl = 0.5  # Cache for 500ms (half a second)
 _lhm_available = None  # None = unknown, True = available, False = unavailable
 _lhm_check_interval = 10  # Check availability every 10 seconds when unavailable
+_lhm_lock = threading.Lock()
+_LHM_HOST = "localhost"
+_LHM_PORT = 8085
+_LHM_PATH = "/data.json"
+_lhm_conn = None  # Keep-alive connection reused across fetches
 
-def _get_lhm_data():
+
+def _fetch_lhm_json():
+    """
+    Fetch and parse data.json over the persistent LHM connection.
+    Must be called with _lhm_lock held.
+
+    Returns:
+        Parsed LHM sensor tree
     """
-    Get LibreHardwareMonitor data with caching.
-    Returns cached data if fresh, otherwise fetches new data.
-    Returns None if LHM is unavailable.
+    global _lhm_conn
+
+    while True:
+        reused = _lhm_conn is not None
+        if not reused:
+            _lhm_conn = http.client.HTTPConnection(_LHM_HOST, _LHM_PORT, timeout=0.5)
+        try:
+            _lhm_conn.request("GET", _LHM_PATH, headers={"Connection": "keep-alive"})
+            response = _lhm_conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise http.client.HTTPException(f"LHM returned HTTP {response.status}")
+            if response.will_close:
+                # Server refused keep-alive - reconnect on the next fetch
+                _lhm_conn.close()
+                _lhm_conn = None
+            return _json_loads(body)
+        except (OSError, http.client.HTTPException) as e:
+            # Drop the broken socket so the next fetch reconnects
+            _lhm_conn.close()
+            _lhm_conn = None
+            # The server may close an idle keep-alive socket - retry that once
+            # on a fresh connection instead of marking LHM unavailable
+            if not (reused and isinstance(e, (ConnectionError, http.client.BadStatusLine))):
+                raise
+
+
+# Hardware ID prefix -> index bucket for the LHM hardware consumers
+_LHM_HARDWARE_BUCKETS = (
+    ('/gpu-', 'gpu'),
+    ('/intelcpu', 'cpu'),
+    ('/amdcpu', 'cpu'),
+    ('/memory/', 'memory'),
+    ('/nvme/', 'nvme'),
+    ('/nic/', 'nic'),
+)
+
+
+def _index_lhm_tree(root):
+    """
+    Flatten the LHM sensor tree into hardware nodes grouped by type.
+    One iterative pass per fetch replaces a full tree walk per consumer.
+
+    Args:
+        root: Parsed data.json tree
+
+    Returns:
+        dict: Bucket name -> hardware nodes in tree order
+              (keys: 'gpu', 'cpu', 'memory', 'nvme', 'nic')
+    """
+    index = {bucket: [] for _, bucket in _LHM_HARDWARE_BUCKETS}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        hardware_id = node.get('HardwareId')
+        if hardware_id:
+            hardware_id = hardware_id.lower()
+            bucket = next((bucket for prefix, bucket in _LHM_HARDWARE_BUCKETS
+                           if hardware_id.startswith(prefix)), None)
+            if bucket is not None:
+                # Indexed hardware holds only its own sensors - no need to descend
+                index[bucket].append(node)
+                continue
+
+        # Reversed so nodes pop in document order (first match wins as before);
+        # sensor leaves have no children and are never pushed
+        children = node.get('Children')
+        if children:
+            stack.extend([child for child in reversed(children) if child.get('Children')])
+    return index
+
+
+def _get_lhm_hardware():
+    """
+    Get LibreHardwareMonitor hardware nodes with caching.
+    Returns the cached index if fresh, otherwise fetches and indexes new data.
+
+    Returns:
+        dict or None: Hardware nodes by bucket (see _index_lhm_tree),
+                      None if LHM is unavailable
     """
     global _lhm_cache, _lhm_cache_time, _lhm_available
     
-    current_time = time.time()
+    # Collector and sampler threads share the cache - fetch it once at a time
+    with _lhm_lock:
+        current_time = time.monotonic()
     
-    # Check if LHM was previously marked unavailable
-    if _lhm_available is False:
-        # Only retry every _lhm_check_interval seconds
-        if current_time - _lhm_cache_time < _lhm_check_interval:
-            return None
+        # Check if LHM was previously marked unavailable
+        if _lhm_available is False:
+            # Only retry every _lhm_check_interval seconds
+            if current_time - _lhm_cache_time < _lhm_check_interval:
+                return None
     
-    # Check if cache is still valid
-    if _lhm_cache is not None and (current_time - _lhm_cache_time) < _lhm_cache_ttl:
-        return _lhm_cache
+        # Check if cache is still valid
+        if _lhm_cache is not None and (current_time - _lhm_cache_time) < _lhm_cache_ttl:
+            return _lhm_cache
     
-    # Fetch new data
-    try:
-        url = "http://localhost:8085/data.json"
-        with urllib.request.urlopen(url, timeout=0.5) as response:
-            _lhm_cache = json.loads(response.read().decode())
+        # Fetch new data
+        try:
+            _lhm_cache = _index_lhm_tree(_fetch_lhm_json())
             _lhm_cache_time = current_time
             _lhm_available = True
             return _lhm_cache
-    except Exception:
-        _lhm_cache = None
-        _lhm_cache_time = current_time
-        _lhm_available = False
-        return None
+        except (OSError, ValueError, http.client.HTTPException):
+            # Not running (connection refused/timeout) or a malformed response
+            _lhm_cache = None
+            _lhm_cache_time = current_time
+            _lhm_available = False
+            return None
+
 
+# LHM throughput unit -> multiplier to KB/s and to MB/s
+_KBS_PER_UNIT = {'B/s': 1.0 / 1024, 'KB/s': 1.0, 'MB/s': 1024.0, 'GB/s': 1024.0 * 1024}
+_MBS_PER_UNIT = {'': 1.0 / 1024, 'B/s': 1.0 / (1024 * 1024), 'KB/s': 1.0 / 1024,
+                 'MB/s': 1.0, 'GB/s': 1024.0}
 
-def _search_lhm_node(node, predicate, result_extractor):
+
+def _parse_num(value_str):
     """
-    Generic recursive search through LHM data tree.
-    
+    Parse the number from an LHM sensor value such as "72.0 °C" or "45.0 %"
+
     Args:
-        node: Current node to search
-        predicate: Function that returns True if this is the node we want
-        result_extractor: Function that extracts data from the found node
-    
+        value_str: Sensor value text (number, space, unit)
+
     Returns:
-        Result from result_extractor or None if not found
+        float: Numeric value (0.0 for an empty string)
+
+    Raises:
+        ValueError: If the value does not start with a number
     """
-    if node is None:
-        return None
-    
-    if isinstance(node, dict):
-        if predicate(node):
-            return result_extractor(node)
-        
-        for child in node.get('Children', []):
-            result = _search_lhm_node(child, predicate, result_extractor)
-            if result is not None:
-                return result
-    
-    elif isinstance(node, list):
-        for item in node:
-            result = _search_lhm_node(item, predicate, result_extractor)
-            if result is not None:
-                return result
-    
-    return None
+    head = value_str.partition(' ')[0]
+    return float(head) if head else 0.0
+
+
+# Host name never changes while the process runs - read it once
+_HOSTNAME = socket.gethostname()
+
+# Metrics that never change while the process runs, merged into every sample
+_STATIC_METRICS = MappingProxyType({
+    'ram_name': 'XPG Lancer DDR5 6400MHz',  # Generic name for RAM
+    'disk_name': 'Samsung SSD 990 PRO 2TB',  # Example static name
+    'hostname': _HOSTNAME,
+})
+
+
+# ============== Tiered Polling ==============
+# Slow-changing metrics are re-polled at their own rate instead of every frame
+_poll_cache = {}  # key -> (timestamp, value)
+
+# Re-poll interval per metric in seconds.
+# Fast metrics (CPU usage, network and disk I/O speeds) are read on every
+# collection and are not listed; tune the rest here.
+RATE_POLICY = {
+    # Medium tier
+    'ram': 0.5,
+    'cpu_freq': 2,
+    'sensors': 1.0,  # GPU and temperatures, sampled by SlowMetricsSampler
+    # Slow tier
+    'disk': 30,  # Disk totals never change, used space drifts over minutes
+    # DIMM and NVMe temperatures move slowly (sampled by SlowMetricsSampler)
+    'ram_temps': 4,
+    'nvme_temp': 4,
+    # WMI CPU temperature fallback - COM queries that usually fail
+    'wmi_cpu_temp': 10,
+}
+
+
+def _poll_cached(key, fetch):
+    """
+    Return a cached value, re-polling it at most once per RATE_POLICY interval
+
+    Args:
+        key: Metric name in RATE_POLICY (also the cache key)
+        fetch: Zero-argument function that polls the metric
+
+    Returns:
+        The cached or freshly polled value
+    """
+    interval = RATE_POLICY[key]
+    now = time.monotonic()
+    entry = _poll_cache.get(key)
+    if entry is not None and now - entry[0] < interval:
+        return entry[1]
+
+    value = fetch()
+    _poll_cache[key] = (now, value)
+    return value
+
+
+_GB_PER_BYTE = 1.0 / (1024 ** 3)
+
+# Prime psutil's CPU counters at import so the first readings are real deltas
+psutil.cpu_percent(interval=None)
+psutil.cpu_percent(percpu=True, interval=None)
 
 
 def get_cpu_usage():
     """
-    Get current CPU usage percentage
+    Get current CPU usage percentage (non-blocking)
+
+    Measures usage since the previous call instead of sleeping for a
+    sample window. Callers already wait between calls, so call at
+    intervals of at least 200 ms for a meaningful reading (the metrics
+    collector runs every UPDATE_INTERVAL_MS / 2).
 
     Returns:
         float: CPU usage percentage (0-100)
     """
-    return psutil.cpu_percent(interval=0.1)
+    return psutil.cpu_percent(interval=None)
+
+
+# Used/total capacity in GB and usage percentage (RAM and disk)
+UsageInfo = namedtuple('UsageInfo', 'used total percent')
+
+# Reported when the drive can't be read
+_NO_DISK_USAGE = UsageInfo(0.0, 0.0, 0.0)
 
 
 def get_ram_usage():
@@ -105,30 +357,58 @@ def get_ram_usage():
     Get current RAM usage information
 
     Returns:
-        dict: Dictionary containing:
+        UsageInfo: Named tuple containing:
             - used: Used RAM in GB
             - total: Total RAM in GB
             - percent: Usage percentage (0-100)
     """
-    mem = psutil.virtual_memory()
-    return {
-        'used': mem.used / (1024 ** 3),  # Convert to GB
-        'total': mem.total / (1024 ** 3),  # Convert to GB
-        'percent': mem.percent
-    }
+    used, total, percent = _read_memory()
+    return UsageInfo(used * _GB_PER_BYTE, total * _GB_PER_BYTE, percent)
 
 
-def get_current_time(format_str="%H:%M:%S"):
+# Clock formats for the time and date metrics
+_TIME_FORMAT = "%H:%M:%S"
+_DATE_FORMAT = "%a, %b %d"
+
+
+def get_current_time(format_str=_TIME_FORMAT, now=None):
     """
     Get current system time
 
     Args:
         format_str: Time format string (default: HH:MM:SS)
+        now: time.struct_time to format (default: read the clock)
 
     Returns:
         str: Formatted time string
     """
-    return datetime.now().strftime(format_str)
+    if now is None:
+        return time.strftime(format_str)
+    return time.strftime(format_str, now)
+
+
+# Date metric for the current day - formatted again only when the day changes
+_date_day = None
+_date_text = ''
+
+
+def _format_date(now):
+    """
+    Format the date metric, reusing the string for the rest of the day
+
+    Args:
+        now: time.struct_time of the current sample
+
+    Returns:
+        str: Formatted date string
+    """
+    global _date_day, _date_text
+
+    day = (now.tm_year, now.tm_yday)
+    if day != _date_day:
+        _date_text = time.strftime(_DATE_FORMAT, now)
+        _date_day = day
+    return _date_text
 
 
 def get_disk_usage():
@@ -136,22 +416,217 @@ def get_disk_usage():
     Get C: drive usage information
 
     Returns:
-        dict: Dictionary containing:
+        UsageInfo: Named tuple containing:
             - used: Used disk space in GB
             - total: Total disk space in GB
             - percent: Usage percentage (0-100)
+            All zero if there is no C: drive (e.g. on Linux)
     """
-    disk = psutil.disk_usage('C:\\')
-    return {
-        'used': disk.used / (1024 ** 3),  # Convert to GB
-        'total': disk.total / (1024 ** 3),  # Convert to GB
-        'percent': disk.percent
+    try:
+        disk = psutil.disk_usage('C:\\')
+    except OSError:
+        return _NO_DISK_USAGE
+    return UsageInfo(disk.used * _GB_PER_BYTE, disk.total * _GB_PER_BYTE, disk.percent)
+
+
+# GPU vendor names expected in LibreHardwareMonitor GPU node text
+_GPU_VENDOR_PATTERN = re.compile(r'nvidia|geforce|rtx|radeon|amd', re.IGNORECASE)
+
+
+def _find_gpu_data(node):
+    """
+    Extract GPU metrics from an LHM GPU hardware node
+
+    Args:
+        node: Hardware node from the 'gpu' bucket
+
+    Returns:
+        dict or None: GPU metrics, None if not a discrete GPU or no data
+    """
+    text = node.get('Text', '')
+
+    # Check if this is a discrete GPU (NVIDIA or AMD)
+    if not _GPU_VENDOR_PATTERN.search(text):
+        return None
+
+    # Readings collected in locals, None until the sensor is seen
+    temp = hotspot = load = memory_load = None
+    clock = memory_clock = power = memory_used = memory_total = None
+
+    # Parse all children to extract metrics
+    for child in node.get('Children', []):
+        child_text = child.get('Text', '')
+
+        # Temperatures
+        if 'Temperature' in child_text:
+            for sensor in child.get('Children', []):
+                sensor_text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0')
+
+                if 'GPU Core' in sensor_text and temp is None:
+                    temp = _parse_num(value_str)
+                elif 'Hot Spot' in sensor_text or 'Hotspot' in sensor_text:
+                    hotspot = _parse_num(value_str)
+
+        # Load/Usage
+        elif 'Load' in child_text:
+            for sensor in child.get('Children', []):
+                sensor_text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0 %')
+
+                if 'GPU Core' in sensor_text and load is None:
+                    load = _parse_num(value_str)
+                elif 'GPU Memory' in sensor_text and memory_load is None:
+                    memory_load = _parse_num(value_str)
+
+        # Clocks
+        elif 'Clock' in child_text:
+            for sensor in child.get('Children', []):
+                sensor_text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0 MHz')
+
+                if 'GPU Core' in sensor_text:
+                    clock = _parse_num(value_str)
+                elif 'GPU Memory' in sensor_text:
+                    memory_clock = _parse_num(value_str)
+
+        # Power
+        elif 'Power' in child_text:
+            for sensor in child.get('Children', []):
+                sensor_text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0 W')
+
+                if 'GPU' in sensor_text or 'Package' in sensor_text:
+                    power = _parse_num(value_str)
+
+        # Memory Data (MB)
+        elif 'Data' in child_text or 'SmallData' in child_text:
+            for sensor in child.get('Children', []):
+                sensor_text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0 MB')
+
+                if 'Memory Used' in sensor_text:
+                    memory_used = _parse_num(value_str)
+                    if value_str.endswith('GB'):
+                        memory_used *= 1024
+                elif 'Memory Total' in sensor_text:
+                    memory_total = _parse_num(value_str)
+                    if value_str.endswith('GB'):
+                        memory_total *= 1024
+
+    # Only return if we got at least temperature or load data
+    if temp is None and load is None:
+        return None
+
+    # Build the result once, with defaults for the core readings
+    gpu_data = {
+        'gpu_name': text,
+        'gpu_temp': 0.0 if temp is None else temp,
+        'gpu_percent': 0.0 if load is None else load,
+        'gpu_memory_percent': 0.0 if memory_load is None else memory_load,
     }
+    # Optional readings are only reported when the GPU exposes them
+    for key, value in (('gpu_hotspot_temp', hotspot), ('gpu_clock', clock),
+                       ('gpu_memory_clock', memory_clock), ('gpu_power', power),
+                       ('gpu_memory_used', memory_used), ('gpu_memory_total', memory_total)):
+        if value is not None:
+            gpu_data[key] = value
+    return gpu_data
+
+
+def _get_lhm_gpu_usage():
+    """
+    Get GPU metrics from the LibreHardwareMonitor sensor tree
+
+    Returns:
+        dict or None: GPU metrics (see get_gpu_usage), None if unavailable
+    """
+    try:
+        # Use cached LHM data
+        hardware = _get_lhm_hardware()
+        if hardware is None:
+            return None
+        
+        for node in hardware['gpu']:
+            result = _find_gpu_data(node)
+            if result:
+                return result
+        return None
+    except (ValueError, TypeError, AttributeError):
+        # Malformed sensor values - GPU monitoring is optional
+        return None
+
+
+# NVML device handle and GPU name, initialized once on first use
+_nvml_handle = None
+_nvml_name = None
+_nvml_checked = False
+
+
+def _get_nvml_handle():
+    """
+    Initialize NVML once and get the first GPU's handle
+
+    Returns:
+        NVML device handle, or None if pynvml or an NVIDIA GPU is unavailable
+    """
+    global _nvml_handle, _nvml_name, _nvml_checked
+
+    if not _nvml_checked:
+        _nvml_checked = True
+        if pynvml is not None:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                name = pynvml.nvmlDeviceGetName(handle)
+                _nvml_name = name.decode() if isinstance(name, bytes) else name
+                _nvml_handle = handle
+            except pynvml.NVMLError:
+                _nvml_handle = None
+    return _nvml_handle
+
+
+def _get_nvml_gpu_usage():
+    """
+    Get GPU metrics directly from the NVIDIA driver via NVML (in-process)
+
+    Returns:
+        dict or None: GPU metrics (see get_gpu_usage), None if unavailable
+    """
+    handle = _get_nvml_handle()
+    if handle is None:
+        return None
+
+    try:
+        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+        gpu_data = {
+            'gpu_name': _nvml_name,
+            'gpu_percent': float(util.gpu),
+            'gpu_memory_percent': mem.used * 100.0 / mem.total if mem.total else 0.0,
+            'gpu_temp': float(temp),
+            'gpu_clock': float(pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS)),
+            'gpu_memory_clock': float(pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)),
+            'gpu_memory_used': mem.used / (1024 ** 2),  # Convert to MB
+            'gpu_memory_total': mem.total / (1024 ** 2)  # Convert to MB
+        }
+    except pynvml.NVMLError:
+        return None
+
+    # Power readings are not supported on every board
+    try:
+        gpu_data['gpu_power'] = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW to W
+    except pynvml.NVMLError:
+        pass
+    return gpu_data
 
 
 def get_gpu_usage():
     """
-    Get GPU usage information from LibreHardwareMonitor
+    Get GPU usage information from LibreHardwareMonitor, falling back to
+    NVML (NVIDIA only) when LibreHardwareMonitor has no GPU data
 
     Returns:
         dict or None: Dictionary containing GPU metrics if available:
@@ -167,329 +642,639 @@ def get_gpu_usage():
             - gpu_memory_total: GPU memory total in MB (if available)
         Returns None if no GPU data available
     """
+    return _get_lhm_gpu_usage() or _get_nvml_gpu_usage()
+
+
+def _resolve_cpu_name():
+    """
+    Look up the CPU model name via WMI on Windows
+
+    Returns:
+        str: CPU model name (e.g., "Intel Core i7-12700K") or generic name
+    """
+    c = _get_wmi_connection()
+    if c is not None:
+        try:
+            for processor in c.Win32_Processor():
+                return processor.Name.strip()
+        except Exception:
+            # COM/WMI errors - fall back below
+            pass
+
+    # Fallback to platform.processor() if WMI is missing or fails
+    proc_name = platform.processor()
+    if proc_name:
+        return proc_name
+    return "Unknown CPU"
+
+
+def _resolve_cpu_name_once():
+    """Resolve the CPU name into _cpu_name (runs on a background thread)"""
+    global _cpu_name
+    _cpu_name = _resolve_cpu_name()
+
+
+# The WMI lookup can take 100+ ms - resolve it once on a background thread,
+# off the collection path, started on first use (not at import)
+_cpu_name = None
+_cpu_name_thread = None
+_cpu_name_lock = threading.Lock()
+
+
+def _start_cpu_name_lookup():
+    """
+    Start the background CPU name lookup if it hasn't been started yet
+
+    Returns:
+        threading.Thread: The lookup thread
+    """
+    global _cpu_name_thread
+
+    with _cpu_name_lock:
+        if _cpu_name_thread is None:
+            _cpu_name_thread = threading.Thread(target=_resolve_cpu_name_once,
+                                                name='cpu-name', daemon=True)
+            _cpu_name_thread.start()
+        return _cpu_name_thread
+
+
+def get_cpu_name():
+    """
+    Get the CPU model name (resolved once in the background on first call)
+
+    Returns:
+        str: CPU model name, or "Detecting..." until the lookup finishes
+    """
+    if _cpu_name is not None:
+        return _cpu_name
+    _start_cpu_name_lookup()
+    return "Detecting..."
+
+
+def wait_for_cpu_name(timeout=None):
+    """
+    Wait for the background CPU name lookup (for one-shot callers that
+    would otherwise report "Detecting...")
+
+    Args:
+        timeout: Maximum seconds to wait (None waits until it finishes)
+
+    Returns:
+        str: CPU model name, or "Detecting..." if the timeout expired
+    """
+    _start_cpu_name_lookup().join(timeout)
+    return get_cpu_name()
+
+
+def _find_cpu_temp(node):
+    """
+    Read the package (or core average) temperature from an LHM CPU node
+
+    Args:
+        node: Hardware node from the 'cpu' bucket (Intel or AMD)
+
+    Returns:
+        float: CPU temperature in Celsius, or 0 if not found
+    """
+    for child in node.get('Children', []):
+        if child.get('Text') != 'Temperatures':
+            continue
+        # Look for CPU Package or Core Average, stopping at the first one
+        for temp_sensor in child.get('Children', []):
+            sensor_text = temp_sensor.get('Text', '')
+            if 'Package' in sensor_text or 'Average' in sensor_text:
+                return _parse_num(temp_sensor.get('Value', '0.0 °C'))
+        # A CPU has a single temperatures group
+        break
+    return 0
+
+
+def get_cpu_temp_from_libre_hardware_monitor():
+    """
+    Get CPU temperature from LibreHardwareMonitor web server
+    
+    Returns:
+        float: CPU temperature in Celsius, or 0 if not available
+    """
     try:
         # Use cached LHM data
-        data = _get_lhm_data()
-        if data is None:
-            return None
+        hardware = _get_lhm_hardware()
+        if hardware is None:
+            return 0
         
-        # Recursively search for GPU data
-        def find_gpu_data(node):
-            text = node.get('Text', '')
-            hardware_id = node.get('HardwareId', '').lower()
-            
-            # Check if this is a GPU node (NVIDIA or AMD)
-            if ('nvidia' in text.lower() or 'geforce' in text.lower() or 'rtx' in text.lower() or 
-                'radeon' in text.lower() or 'amd' in text.lower()) and \
-               ('gpu-nvidia' in hardware_id or 'gpu-amd' in hardware_id or 'gpu-intel' in hardware_id):
-                
-                gpu_data = {'gpu_name': text}
-                
-                # Parse all children to extract metrics
-                for child in node.get('Children', []):
-                    child_text = child.get('Text', '')
-                    
-                    # Temperatures
-                    if 'Temperature' in child_text:
-                        for sensor in child.get('Children', []):
-                            sensor_text = sensor.get('Text', '')
-                            value_str = sensor.get('Value', '0.0')
-                            
-                            if 'GPU Core' in sensor_text and 'gpu_temp' not in gpu_data:
-                                gpu_data['gpu_temp'] = float(value_str.replace('°C', '').replace('°', '').strip())
-                            elif 'Hot Spot' in sensor_text or 'Hotspot' in sensor_text:
-                                gpu_data['gpu_hotspot_temp'] = float(value_str.replace('°C', '').replace('°', '').strip())
-                    
-                    # Load/Usage
-                    elif 'Load' in child_text:
-                        for sensor in child.get('Children', []):
-                            sensor_text = sensor.get('Text', '')
-                            value_str = sensor.get('Value', '0.0 %')
-                            
-                            if 'GPU Core' in sensor_text and 'gpu_percent' not in gpu_data:
-                                gpu_data['gpu_percent'] = float(value_str.replace('%', '').strip())
-                            elif 'GPU Memory' in sensor_text and 'gpu_memory_percent' not in gpu_data:
-                                gpu_data['gpu_memory_percent'] = float(value_str.replace('%', '').strip())
-                    
-                    # Clocks
-                    elif 'Clock' in child_text:
-                        for sensor in child.get('Children', []):
-                            sensor_text = sensor.get('Text', '')
-                            value_str = sensor.get('Value', '0.0 MHz')
-                            
-                            if 'GPU Core' in sensor_text:
-                                gpu_data['gpu_clock'] = float(value_str.replace('MHz', '').strip())
-                            elif 'GPU Memory' in sensor_text:
-                                gpu_data['gpu_memory_clock'] = float(value_str.replace('MHz', '').strip())
-                    
-                    # Power
-                    elif 'Power' in child_text:
-                        for sensor in child.get('Children', []):
-                            sensor_text = sensor.get('Text', '')
-                            value_str = sensor.get('Value', '0.0 W')
-                            
-                            if 'GPU' in sensor_text or 'Package' in sensor_text:
-                                gpu_data['gpu_power'] = float(value_str.replace('W', '').strip())
-                    
-                    # Memory Data (MB)
-                    elif 'Data' in child_text or 'SmallData' in child_text:
-                        for sensor in child.get('Children', []):
-                            sensor_text = sensor.get('Text', '')
-                            value_str = sensor.get('Value', '0.0 MB')
-                            
-                            if 'Memory Used' in sensor_text:
-                                gpu_data['gpu_memory_used'] = float(value_str.replace('MB', '').replace('GB', '').strip())
-                                if 'GB' in value_str:
-                                    gpu_data['gpu_memory_used'] *= 1024
-                            elif 'Memory Total' in sensor_text:
-                                gpu_data['gpu_memory_total'] = float(value_str.replace('MB', '').replace('GB', '').strip())
-                                if 'GB' in value_str:
-                                    gpu_data['gpu_memory_total'] *= 1024
-                
-                # Only return if we got at least temperature or load data
-                if 'gpu_temp' in gpu_data or 'gpu_percent' in gpu_data:
-                    # Set defaults for missing values
-                    gpu_data.setdefault('gpu_percent', 0.0)
-                    gpu_data.setdefault('gpu_memory_percent', 0.0)
-                    gpu_data.setdefault('gpu_temp', 0.0)
-                    return gpu_data
-            
-            # Recursively search children
-            for child in node.get('Children', []):
-                result = find_gpu_data(child)
-                if result:
-                    return result
-            return None
+        for node in hardware['cpu']:
+            result = _find_cpu_temp(node)
+            if result > 0:
+                return result
+        return 0
+    except (ValueError, TypeError, AttributeError):
+        # Malformed sensor values
+        return 0
+
+
+# DIMM slot number in LHM memory sensor names ("DIMM #1")
+_DIMM_SLOT_PATTERN = re.compile(r'DIMM[^#]*#(\d+)')
+
+# DIMM slot number -> data source key (slots 1-4 are reported)
+_DIMM_TEMP_KEYS = {str(slot): f'dimm_{slot}_temp' for slot in range(1, 5)}
+
+
+def get_ram_temperatures():
+    """
+    Get RAM/DIMM temperatures from LibreHardwareMonitor
+
+    Returns:
+        dict: Dictionary containing:
+            - dimm_1_temp: DIMM #1 temperature in Celsius (0 if unavailable)
+            - dimm_2_temp: DIMM #2 temperature in Celsius (0 if unavailable)
+            - dimm_3_temp: DIMM #3 temperature in Celsius (0 if unavailable)
+            - dimm_4_temp: DIMM #4 temperature in Celsius (0 if unavailable)
+            - ram_temp_avg: Average temperature of populated DIMMs (0 if none)
+    """
+    try:
+        # Use cached LHM data
+        hardware = _get_lhm_hardware()
+        if hardware is None:
+            return {'dimm_1_temp': 0, 'dimm_2_temp': 0, 'dimm_3_temp': 0, 'dimm_4_temp': 0, 'ram_temp_avg': 0}
+        
+        result = {'dimm_1_temp': 0, 'dimm_2_temp': 0, 'dimm_3_temp': 0, 'dimm_4_temp': 0, 'ram_temp_avg': 0}
         
-        return find_gpu_data(data)
-    except Exception as e:
-        # Silently fail - GPU monitoring is optional
+        # DIMM temperature sensors sit under the memory hardware nodes
+        for node in hardware['memory']:
+            for group in node.get('Children', []):
+                for sensor in group.get('Children', []):
+                    if sensor.get('Type') != 'Temperature':
+                        continue
+                    # Slot number from text like "DIMM #1", "DIMM #3"
+                    match = _DIMM_SLOT_PATTERN.search(sensor.get('Text', ''))
+                    key = _DIMM_TEMP_KEYS.get(match.group(1)) if match else None
+                    if key is None:
+                        continue
+                    try:
+                        result[key] = _parse_num(sensor.get('Value', '0.0 °C'))
+                    except ValueError:
+                        pass
+        
+        # Calculate average of populated DIMMs
+        total = 0.0
+        count = 0
+        for key in _DIMM_TEMP_KEYS.values():
+            temp = result[key]
+            if temp > 0:
+                total += temp
+                count += 1
+        if count:
+            result['ram_temp_avg'] = round(total / count, 1)
+        
+        return result
+    except (ValueError, TypeError, AttributeError):
+        # Malformed sensor values
         pass
-    return None
+    
+    return {'dimm_1_temp': 0, 'dimm_2_temp': 0, 'dimm_3_temp': 0, 'dimm_4_temp': 0, 'ram_temp_avg': 0}
 
 
-def get_cpu_name():
+def _find_nvme_temp(node):
+    """
+    Read the first temperature sensor from an LHM NVMe node
+
+    Args:
+        node: Hardware node from the 'nvme' bucket
+
+    Returns:
+        float: NVMe temperature in Celsius, or 0 if not found
+    """
+    # Look for temperature in children
+    for child in node.get('Children', []):
+        if child.get('Text') == 'Temperatures':
+            # Get first temperature sensor (usually the main one)
+            for temp_sensor in child.get('Children', []):
+                if temp_sensor.get('Type') == 'Temperature':
+                    value_str = temp_sensor.get('Value', '0.0 °C')
+                    try:
+                        return _parse_num(value_str)
+                    except ValueError:
+                        pass
+    return 0
+
+
+def get_nvme_temperature():
+    """
+    Get NVMe SSD temperature from LibreHardwareMonitor
+
+    Returns:
+        float: NVMe temperature in Celsius (0 if unavailable)
+    """
+    try:
+        # Use cached LHM data
+        hardware = _get_lhm_hardware()
+        if hardware is None:
+            return 0
+        
+        for node in hardware['nvme']:
+            temp = _find_nvme_temp(node)
+            if temp > 0:
+                return temp
+        return 0
+    except (ValueError, TypeError, AttributeError):
+        # Malformed sensor values
+        return 0
+
+
+# psutil.sensors_temperatures() does not exist on Windows, and some systems
+# expose no sensors at all - None until probed on the first call
+_sensors_supported = None
+
+# (chip name, sensor label) -> sensor name (the pairs are stable)
+_sensor_names = {}
+
+
+def get_component_temperatures():
+    """
+    Get all available temperature sensors
+
+    Returns:
+        dict: Dictionary of temperature readings (empty if none available)
+              Keys are sensor names, values are temperatures in Celsius
+    """
+    global _sensors_supported
+
+    temps = {}
+    if _sensors_supported is False:
+        return temps
+
+    try:
+        temps_info = psutil.sensors_temperatures()
+    except (AttributeError, OSError, NotImplementedError):
+        temps_info = None
+
+    if _sensors_supported is None:
+        # Stop asking if the first probe finds no sensors
+        _sensors_supported = bool(temps_info)
+
+    if temps_info:
+        for name, entries in temps_info.items():
+            for entry in entries:
+                # Unique key for each sensor, built once per sensor
+                label = entry.label
+                key = _sensor_names.get((name, label))
+                if key is None:
+                    key = f"{name}_{label}" if label else name
+                    _sensor_names[(name, label)] = key
+                temps[key] = entry.current
+    return temps
+
+
+# psutil sensor key that last reported the CPU temperature (found by scanning once)
+_cpu_temp_key = None
+_cpu_temp_scanned = None  # Sensor names the key was detected from
+
+# WMI namespaces published by hardware monitor apps, in order of preference
+_WMI_SENSOR_NAMESPACES = ("root\\OpenHardwareMonitor", "root\\LibreHardwareMonitor")
+
+# psutil sensor names that identify a CPU temperature (varies by platform)
+_CPU_TEMP_PATTERN = re.compile(r'coretemp|cpu|k10temp|zenpower', re.IGNORECASE)
+
+
+def _detect_cpu_temp_key(temps):
+    """
+    Find the CPU temperature sensor, scanning only when the sensor set changes
+
+    Args:
+        temps: Sensor readings from get_component_temperatures()
+
+    Returns:
+        str or None: Name of the CPU temperature sensor, None if there is none
+    """
+    global _cpu_temp_key, _cpu_temp_scanned
+
+    # Sensor names are stable - reuse the result of the last scan
+    if _cpu_temp_key in temps or temps.keys() == _cpu_temp_scanned:
+        return _cpu_temp_key
+
+    _cpu_temp_key = next((key for key in temps if _CPU_TEMP_PATTERN.search(key)), None)
+    _cpu_temp_scanned = set(temps)
+    return _cpu_temp_key
+
+
+def _read_cpu_temperature(source, temps):
+    """
+    Read the CPU temperature from one source
+
+    Args:
+        source: One of _CPU_TEMP_SOURCES
+        temps: Sensor readings from get_component_temperatures()
+
+    Returns:
+        float: CPU temperature in Celsius (0 if unavailable)
+    """
+    if source == 'lhm':
+        # LibreHardwareMonitor web server (most reliable on Windows)
+        return get_cpu_temp_from_libre_hardware_monitor()
+    if source == 'psutil':
+        # psutil sensors (Linux/Mac)
+        cpu_key = _detect_cpu_temp_key(temps)
+        return temps[cpu_key] if cpu_key is not None else 0
+    # WMI methods (rarely work, so polled at a slow rate)
+    if _get_wmi() is None:
+        return 0
+    return _poll_cached('wmi_cpu_temp', _get_wmi_cpu_temperature)
+
+
+# CPU temperature sources in order of preference
+_CPU_TEMP_SOURCES = ('lhm', 'psutil', 'wmi')
+
+# Source that last reported a CPU temperature (None = search all sources)
+_cpu_temp_source = None
+
+
+def get_cpu_temperature(temps):
+    """
+    Get CPU temperature from the first source that reports one
+
+    Tries LibreHardwareMonitor, then psutil sensors, then WMI namespaces.
+    Once a source works it is read alone until it stops reporting.
+
+    Args:
+        temps: Sensor readings from get_component_temperatures()
+
+    Returns:
+        float: CPU temperature in Celsius (0 if unavailable)
+    """
+    global _cpu_temp_source
+
+    # Sources rarely change while running - try the last working one alone
+    if _cpu_temp_source is not None:
+        cpu_temp = _read_cpu_temperature(_cpu_temp_source, temps)
+        if cpu_temp != 0:
+            return cpu_temp
+
+    for source in _CPU_TEMP_SOURCES:
+        if source == _cpu_temp_source:
+            continue
+        cpu_temp = _read_cpu_temperature(source, temps)
+        if cpu_temp != 0:
+            _cpu_temp_source = source
+            return cpu_temp
+
+    _cpu_temp_source = None
+    return 0
+
+
+def _get_wmi_cpu_temperature():
+    """
+    Get CPU temperature from the OpenHardwareMonitor/LibreHardwareMonitor
+    WMI namespaces
+
+    Returns:
+        float: CPU temperature in Celsius (0 if unavailable)
+    """
+    # Try the OpenHardwareMonitor, then the LibreHardwareMonitor namespace
+    for namespace in _WMI_SENSOR_NAMESPACES:
+        w = _get_wmi_connection(namespace)
+        if w is None:
+            continue
+        try:
+            for sensor in w.Sensor():
+                if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
+                    cpu_temp = float(sensor.Value)
+                    if cpu_temp != 0:
+                        return cpu_temp
+                    break
+        except Exception:
+            # COM/WMI errors (app not running)
+            continue
+    return 0
+
+
+# Global network counter storage for speed calculation
+_last_net_io = None
+_last_net_time = None
+
+_MB_PER_KB = 1.0 / 1024
+
+# Shared read-only result for network speed early exits (no per-call dict)
+_ZERO_NET_SPEED = MappingProxyType({
+    'upload_kbs': 0.0,
+    'download_kbs': 0.0,
+    'upload_mbs': 0.0,
+    'download_mbs': 0.0
+})
+
+# Global disk I/O counter storage for speed calculation
+_last_disk_io = None
+_last_disk_io_time = None
+
+# Shared read-only result for disk I/O speed early exits (no per-call dict)
+_ZERO_DISK_IO = MappingProxyType({
+    'disk_read_mbs': 0.0,
+    'disk_write_mbs': 0.0,
+    'disk_read_kbs': 0.0,
+    'disk_write_kbs': 0.0
+})
+
+# On Linux, read the kernel counters directly instead of through psutil
+_IS_LINUX = sys.platform.startswith('linux')
+_DISKSTATS_SECTOR_SIZE = 512  # /proc/diskstats always counts 512-byte sectors
+_whole_disks = {}  # Device name -> True if it is a whole disk (not a partition)
+
+
+def _parse_net_dev(text):
+    """
+    Sum the byte counters of every interface in /proc/net/dev
+
+    Args:
+        text: Contents of /proc/net/dev (bytes)
+
+    Returns:
+        tuple: (bytes_sent, bytes_recv)
+    """
+    bytes_sent = bytes_recv = 0
+    for line in text.splitlines()[2:]:  # Skip the two header lines
+        # Same interfaces as psutil.net_io_counters() (loopback included)
+        fields = line.rpartition(b':')[2].split()
+        bytes_recv += int(fields[0])
+        bytes_sent += int(fields[8])
+    return bytes_sent, bytes_recv
+
+
+def _read_net_counters():
+    """
+    Read total network bytes across all interfaces
+
+    Returns:
+        tuple: (bytes_sent, bytes_recv)
+    """
+    if not _IS_LINUX:
+        io = psutil.net_io_counters()
+        return io.bytes_sent, io.bytes_recv
+
+    with open('/proc/net/dev', 'rb') as f:
+        return _parse_net_dev(f.read())
+
+
+def _parse_diskstats(text):
+    """
+    Sum the read/write counters of whole disks in /proc/diskstats
+
+    Args:
+        text: Contents of /proc/diskstats (bytes)
+
+    Returns:
+        tuple: (read_bytes, write_bytes)
+    """
+    read_sectors = write_sectors = 0
+    for line in text.splitlines():
+        fields = line.split()
+        name = fields[2]
+        is_disk = _whole_disks.get(name)
+        if is_disk is None:
+            # Same rule as psutil: whole disks appear under /sys/block
+            is_disk = os.path.exists(b'/sys/block/' + name.replace(b'/', b'!'))
+            _whole_disks[name] = is_disk
+        if is_disk:
+            read_sectors += int(fields[5])
+            write_sectors += int(fields[9])
+    return read_sectors * _DISKSTATS_SECTOR_SIZE, write_sectors * _DISKSTATS_SECTOR_SIZE
+
+
+def _read_disk_counters():
+    """
+    Read total disk bytes across whole disks (partitions excluded)
+
+    Returns:
+        tuple: (read_bytes, write_bytes)
+    """
+    if not _IS_LINUX:
+        io = psutil.disk_io_counters()
+        return io.read_bytes, io.write_bytes
+
+    with open('/proc/diskstats', 'rb') as f:
+        return _parse_diskstats(f.read())
+
+
+def _parse_meminfo(text):
     """
-    Get CPU model name via WMI on Windows
+    Get RAM usage from /proc/meminfo (same definition as psutil:
+    used = total - available)
+
+    Args:
+        text: Contents of /proc/meminfo (bytes)
 
     Returns:
-        str: CPU model name (e.g., "Intel Core i7-12700K") or generic name
+        tuple: (used_bytes, total_bytes, percent), or None if MemAvailable
+        is missing or unusable (old kernels, some containers)
     """
-    try:
-        import wmi
-        c = wmi.WMI()
-        for processor in c.Win32_Processor():
-            return processor.Name.strip()
-    except:
-        # Fallback to platform.processor() if WMI fails
-        proc_name = platform.processor()
-        if proc_name:
-            return proc_name
-        return "Unknown CPU"
+    total = available = 0
+    for line in text.splitlines():
+        if line.startswith(b'MemTotal:'):
+            total = int(line.split()[1]) * 1024
+        elif line.startswith(b'MemAvailable:'):
+            available = int(line.split()[1]) * 1024
+            break  # MemAvailable follows MemTotal
+    if not total or not 0 < available <= total:
+        return None
+    used = total - available
+    return used, total, round(used * 100.0 / total, 1)
 
 
-def get_cpu_temp_from_libre_hardware_monitor():
+def _read_memory():
     """
-    Get CPU temperature from LibreHardwareMonitor web server
-    
+    Read RAM usage (from /proc/meminfo on Linux, psutil elsewhere)
+
     Returns:
-        float: CPU temperature in Celsius, or 0 if not available
+        tuple: (used_bytes, total_bytes, percent)
     """
-    try:
-        # Use cached LHM data
-        data = _get_lhm_data()
-        if data is None:
-            return 0
-        
-        # Recursively search for CPU temperature
-        def find_cpu_temp(node):
-            text = node.get('Text', '')
-            
-            # Check if this is a CPU node (Intel or AMD)
-            if ('Intel Core' in text or 'AMD Ryzen' in text or 'AMD EPYC' in text) and 'intelcpu' in node.get('HardwareId', '').lower() or 'amdcpu' in node.get('HardwareId', '').lower():
-                # Found the CPU, now look for temperatures
-                for child in node.get('Children', []):
-                    if 'Temperature' in child.get('Text', ''):
-                        # Found temperatures section
-                        for temp_sensor in child.get('Children', []):
-                            sensor_text = temp_sensor.get('Text', '')
-                            # Look for CPU Package or Core Average (prefer Package)
-                            if 'CPU Package' in sensor_text or 'Package' in sensor_text:
-                                value_str = temp_sensor.get('Value', '0.0 °C')
-                                temp = float(value_str.replace('°C', '').replace('°', '').strip())
-                                return temp
-                            elif 'Core Average' in sensor_text or 'Average' in sensor_text:
-                                value_str = temp_sensor.get('Value', '0.0 °C')
-                                temp = float(value_str.replace('°C', '').replace('°', '').strip())
-                                return temp
-            
-            # Recursively search children
-            for child in node.get('Children', []):
-                result = find_cpu_temp(child)
-                if result > 0:
-                    return result
-            return 0
-        
-        return find_cpu_temp(data)
-    except Exception as e:
-        # Silently fail
-        pass
-    return 0
+    if _IS_LINUX:
+        with open('/proc/meminfo', 'rb') as f:
+            usage = _parse_meminfo(f.read())
+        if usage is not None:
+            return usage
 
+    mem = psutil.virtual_memory()
+    return mem.used, mem.total, mem.percent
 
-def get_ram_temperatures():
+
+def _parse_cpu_times(text):
     """
-    Get RAM/DIMM temperatures from LibreHardwareMonitor
+    Get busy and total CPU time for each logical CPU from /proc/stat
+
+    Args:
+        text: Contents of /proc/stat (bytes)
 
     Returns:
-        dict: Dictionary containing:
-            - dimm_1_temp: DIMM #1 temperature in Celsius (0 if unavailable)
-            - dimm_2_temp: DIMM #2 temperature in Celsius (0 if unavailable)
-            - dimm_3_temp: DIMM #3 temperature in Celsius (0 if unavailable)
-            - dimm_4_temp: DIMM #4 temperature in Celsius (0 if unavailable)
-            - ram_temp_avg: Average temperature of populated DIMMs (0 if none)
+        list: (busy_ticks, total_ticks) per CPU
     """
-    try:
-        # Use cached LHM data
-        data = _get_lhm_data()
-        if data is None:
-            return {'dimm_1_temp': 0, 'dimm_2_temp': 0, 'dimm_3_temp': 0, 'dimm_4_temp': 0, 'ram_temp_avg': 0}
-        
-        # Recursively search for RAM/DIMM temperature sensors
-        def find_dimm_temps(node):
-            temps = {}
-            
-            if isinstance(node, dict):
-                # Check if this is a DIMM temperature node
-                if node.get('Type') == 'Temperature' and 'DIMM' in node.get('Text', ''):
-                    dimm_text = node.get('Text', '')
-                    value_str = node.get('Value', '0.0 °C')
-                    try:
-                        temp = float(value_str.split()[0])
-                        # Extract DIMM number from text like "DIMM #1", "DIMM #3"
-                        if '#' in dimm_text:
-                            dimm_num = dimm_text.split('#')[1].split()[0]
-                            temps[f'dimm_{dimm_num}_temp'] = temp
-                    except (ValueError, IndexError):
-                        pass
-                
-                # Recursively search children
-                if 'Children' in node:
-                    for child in node['Children']:
-                        temps.update(find_dimm_temps(child))
-            elif isinstance(node, list):
-                for item in node:
-                    temps.update(find_dimm_temps(item))
-            
-            return temps
-        
-        dimm_temps = find_dimm_temps(data)
-        
-        # Ensure all 4 DIMM slots are represented (0 if not found)
-        result = {
-            'dimm_1_temp': dimm_temps.get('dimm_1_temp', 0),
-            'dimm_2_temp': dimm_temps.get('dimm_2_temp', 0),
-            'dimm_3_temp': dimm_temps.get('dimm_3_temp', 0),
-            'dimm_4_temp': dimm_temps.get('dimm_4_temp', 0)
-        }
-        
-        # Calculate average of populated DIMMs
-        populated_temps = [temp for temp in result.values() if temp > 0]
-        if populated_temps:
-            result['ram_temp_avg'] = round(sum(populated_temps) / len(populated_temps), 1)
-        else:
-            result['ram_temp_avg'] = 0
-        
-        return result
-    except Exception:
-        pass
-    
-    return {'dimm_1_temp': 0, 'dimm_2_temp': 0, 'dimm_3_temp': 0, 'dimm_4_temp': 0, 'ram_temp_avg': 0}
+    times = []
+    for line in text.splitlines()[1:]:  # Skip the aggregate "cpu" line
+        if not line.startswith(b'cpu'):
+            break  # Per-CPU lines come first
+        # user nice system idle iowait irq softirq steal (guest time is
+        # already counted in user/nice, so it is left out like psutil does)
+        fields = [int(x) for x in line.split()[1:9]]
+        total = sum(fields)
+        times.append((total - fields[3] - fields[4], total))
+    return times
+
+
+def _read_cpu_times():
+    """
+    Read busy and total CPU time for each logical CPU from /proc/stat (Linux)
 
+    Returns:
+        list: (busy_ticks, total_ticks) per CPU
+    """
+    with open('/proc/stat', 'rb') as f:
+        return _parse_cpu_times(f.read())
 
-def get_nvme_temperature():
+
+def _cpu_percents(current, last):
     """
-    Get NVMe SSD temperature from LibreHardwareMonitor
+    Get per-CPU usage between two /proc/stat samples
+
+    Args:
+        current: _parse_cpu_times() result of the new sample
+        last: _parse_cpu_times() result of the previous sample
 
     Returns:
-        float: NVMe temperature in Celsius (0 if unavailable)
+        list: Usage percentage (0-100) per logical CPU
     """
-    try:
-        # Use cached LHM data
-        data = _get_lhm_data()
-        if data is None:
-            return 0
-        
-        # Recursively search for NVMe temperature
-        def find_nvme_temp(node):
-            if isinstance(node, dict):
-                # Check if this is an NVMe device
-                if node.get('HardwareId', '').startswith('/nvme/'):
-                    # Look for temperature in children
-                    for child in node.get('Children', []):
-                        if child.get('Text') == 'Temperatures':
-                            # Get first temperature sensor (usually the main one)
-                            for temp_sensor in child.get('Children', []):
-                                if temp_sensor.get('Type') == 'Temperature':
-                                    value_str = temp_sensor.get('Value', '0.0 °C')
-                                    try:
-                                        return float(value_str.split()[0])
-                                    except (ValueError, IndexError):
-                                        pass
-                
-                # Recursively search children
-                if 'Children' in node:
-                    for child in node['Children']:
-                        temp = find_nvme_temp(child)
-                        if temp > 0:
-                            return temp
-            elif isinstance(node, list):
-                for item in node:
-                    temp = find_nvme_temp(item)
-                    if temp > 0:
-                        return temp
-            
-            return 0
-        
-        return find_nvme_temp(data)
-    except Exception:
-        pass
-    return 0
+    if len(last) != len(current):
+        # CPU hotplug - no comparable previous sample
+        return [0.0] * len(current)
+
+    percents = []
+    for (busy, total), (last_busy, last_total) in zip(current, last):
+        total_delta = total - last_total
+        if total_delta <= 0:
+            percents.append(0.0)
+        else:
+            percent = (busy - last_busy) * 100.0 / total_delta
+            percents.append(min(max(percent, 0.0), 100.0))
+    return percents
 
 
-def get_component_temperatures():
+# Previous /proc/stat sample for per-CPU usage deltas (Linux)
+_last_cpu_times = _read_cpu_times() if _IS_LINUX else None
+
+
+def _read_per_cpu_percent():
     """
-    Get all available temperature sensors
+    Get per-CPU usage since the previous call (non-blocking)
 
     Returns:
-        dict: Dictionary of temperature readings (empty if none available)
-              Keys are sensor names, values are temperatures in Celsius
+        list: Usage percentage (0-100) per logical CPU
     """
-    temps = {}
-    try:
-        temps_info = psutil.sensors_temperatures()
-        if temps_info:
-            for name, entries in temps_info.items():
-                for entry in entries:
-                    # Create unique key for each sensor
-                    if entry.label:
-                        key = f"{name}_{entry.label}"
-                    else:
-                        key = name
-                    temps[key] = entry.current
-    except (AttributeError, Exception):
-        # sensors_temperatures() not available on all platforms
-        pass
-    return temps
+    global _last_cpu_times
 
+    if not _IS_LINUX:
+        return psutil.cpu_percent(percpu=True, interval=None)
 
-# Global network counter storage for speed calculation
-_last_net_io = None
-_last_net_time = None
+    current = _read_cpu_times()
+    last = _last_cpu_times
+    _last_cpu_times = current
+    return _cpu_percents(current, last)
 
-# Global disk I/O counter storage for speed calculation
-_last_disk_io = None
-_last_disk_io_time = None
 
 # Global historical data manager for sparklines
 _data_history = DataHistory(max_points=30)
@@ -498,11 +1283,48 @@ _data_history = DataHistory(max_points=30)
 _external_data_manager = ExternalDataManager()
 
 
-def get_network_speed():
+def _find_network_speed(node):
+    """
+    Read upload/download throughput from an LHM network adapter node
+
+    Args:
+        node: Hardware node from the 'nic' bucket
+
+    Returns:
+        dict: upload_kbs and download_kbs (0.0 if not reported)
+    """
+    speeds = {'upload_kbs': 0.0, 'download_kbs': 0.0}
+
+    # Look for throughput data in children
+    for child in node.get('Children', []):
+        if child.get('Text') == 'Throughput':
+            for sensor in child.get('Children', []):
+                text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0 KB/s')
+                try:
+                    # Parse value and convert its unit to KB/s (bare numbers are KB/s)
+                    number, _, unit = value_str.partition(' ')
+                    value = float(number) * _KBS_PER_UNIT.get(unit, 1.0)
+
+                    if 'Upload' in text:
+                        speeds['upload_kbs'] = max(speeds['upload_kbs'], value)
+                    elif 'Download' in text:
+                        speeds['download_kbs'] = max(speeds['download_kbs'], value)
+                except ValueError:
+                    pass
+
+    return speeds
+
+
+def get_network_speed(sample_time=None):
     """
     Get current network upload/download speed from LibreHardwareMonitor
     Falls back to psutil if LibreHardwareMonitor is unavailable
 
+    Args:
+        sample_time: time.monotonic() timestamp for the psutil delta
+                     (shared across metrics in one sample; None = now)
+
     Returns:
         dict: Dictionary containing:
             - upload_kbs: Upload speed in KB/s
@@ -512,142 +1334,103 @@ def get_network_speed():
     """
     # Try LibreHardwareMonitor first (using cached data)
     try:
-        data = _get_lhm_data()
-        if data is not None:
-            
-            # Find active network adapter with throughput data
-            def find_network_speed(node):
-                speeds = {'upload_kbs': 0.0, 'download_kbs': 0.0}
-                
-                if isinstance(node, dict):
-                    # Check if this is a network adapter node
-                    if node.get('HardwareId', '').startswith('/nic/'):
-                        # Look for throughput data in children
-                        for child in node.get('Children', []):
-                            if child.get('Text') == 'Throughput':
-                                for sensor in child.get('Children', []):
-                                    text = sensor.get('Text', '')
-                                    value_str = sensor.get('Value', '0.0 KB/s')
-                                    try:
-                                        # Parse value and unit
-                                        parts = value_str.split()
-                                        value = float(parts[0])
-                                        unit = parts[1] if len(parts) > 1 else 'KB/s'
-                                        
-                                        # Convert to KB/s
-                                        if 'MB/s' in unit:
-                                            value = value * 1024
-                                        elif 'GB/s' in unit:
-                                            value = value * 1024 * 1024
-                                        
-                                        if 'Upload' in text:
-                                            speeds['upload_kbs'] = max(speeds['upload_kbs'], value)
-                                        elif 'Download' in text:
-                                            speeds['download_kbs'] = max(speeds['download_kbs'], value)
-                                    except (ValueError, IndexError):
-                                        pass
-                    
-                    # Recursively search children
-                    if 'Children' in node:
-                        for child in node['Children']:
-                            child_speeds = find_network_speed(child)
-                            # Use the adapter with the highest speeds
-                            if child_speeds['upload_kbs'] > speeds['upload_kbs']:
-                                speeds['upload_kbs'] = child_speeds['upload_kbs']
-                            if child_speeds['download_kbs'] > speeds['download_kbs']:
-                                speeds['download_kbs'] = child_speeds['download_kbs']
-                elif isinstance(node, list):
-                    for item in node:
-                        child_speeds = find_network_speed(item)
-                        if child_speeds['upload_kbs'] > speeds['upload_kbs']:
-                            speeds['upload_kbs'] = child_speeds['upload_kbs']
-                        if child_speeds['download_kbs'] > speeds['download_kbs']:
-                            speeds['download_kbs'] = child_speeds['download_kbs']
-                
-                return speeds
-            
-            speeds = find_network_speed(data)
+        hardware = _get_lhm_hardware()
+        if hardware is not None:
+            speeds = {'upload_kbs': 0.0, 'download_kbs': 0.0}
+            # Use the adapter with the highest speeds
+            for node in hardware['nic']:
+                node_speeds = _find_network_speed(node)
+                if node_speeds['upload_kbs'] > speeds['upload_kbs']:
+                    speeds['upload_kbs'] = node_speeds['upload_kbs']
+                if node_speeds['download_kbs'] > speeds['download_kbs']:
+                    speeds['download_kbs'] = node_speeds['download_kbs']
             return {
                 'upload_kbs': round(speeds['upload_kbs'], 2),
                 'download_kbs': round(speeds['download_kbs'], 2),
-                'upload_mbs': round(speeds['upload_kbs'] / 1024, 3),
-                'download_mbs': round(speeds['download_kbs'] / 1024, 3)
+                'upload_mbs': round(speeds['upload_kbs'] * _MB_PER_KB, 3),
+                'download_mbs': round(speeds['download_kbs'] * _MB_PER_KB, 3)
             }
-    except Exception:
+    except (ValueError, TypeError, AttributeError):
+        # Malformed sensor values - use psutil instead
         pass
 
     # Fallback to psutil method
     global _last_net_io, _last_net_time
 
     try:
-        import time
-        current_io = psutil.net_io_counters()
-        current_time = time.time()
-
-        if _last_net_io is None or _last_net_time is None:
-            # First call - initialize counters
-            _last_net_io = current_io
-            _last_net_time = current_time
-            return {
-                'upload_kbs': 0.0,
-                'download_kbs': 0.0,
-                'upload_mbs': 0.0,
-                'download_mbs': 0.0
-            }
-
-        # Calculate time delta
-        time_delta = current_time - _last_net_time
-        if time_delta == 0:
-            return {
-                'upload_kbs': 0.0,
-                'download_kbs': 0.0,
-                'upload_mbs': 0.0,
-                'download_mbs': 0.0
-            }
+        current_io = _read_net_counters()
+    except (OSError, ValueError, IndexError, AttributeError):
+        # Counters unreadable or unavailable on this system
+        return _ZERO_NET_SPEED
 
-        # Calculate bytes transferred
-        bytes_sent = current_io.bytes_sent - _last_net_io.bytes_sent
-        bytes_recv = current_io.bytes_recv - _last_net_io.bytes_recv
+    current_time = sample_time if sample_time is not None else time.monotonic()
 
-        # Calculate speeds in KB/s
-        upload_kbs = (bytes_sent / time_delta) / 1024
-        download_kbs = (bytes_recv / time_delta) / 1024
-
-        # Update stored values
+    if _last_net_io is None or _last_net_time is None:
+        # First call - initialize counters
         _last_net_io = current_io
         _last_net_time = current_time
+        return _ZERO_NET_SPEED
 
-        return {
-            'upload_kbs': upload_kbs,
-            'download_kbs': download_kbs,
-            'upload_mbs': upload_kbs / 1024,
-            'download_mbs': download_kbs / 1024
-        }
-    except Exception:
-        return {
-            'upload_kbs': 0.0,
-            'download_kbs': 0.0,
-            'upload_mbs': 0.0,
-            'download_mbs': 0.0
-        }
+    # Calculate time delta
+    time_delta = current_time - _last_net_time
+    if time_delta == 0:
+        return _ZERO_NET_SPEED
+
+    # Calculate speeds in KB/s (one divide shared by both directions)
+    kbs_per_byte = 1.0 / (time_delta * 1024)
+    upload_kbs = (current_io[0] - _last_net_io[0]) * kbs_per_byte
+    download_kbs = (current_io[1] - _last_net_io[1]) * kbs_per_byte
 
+    # Update stored values
+    _last_net_io = current_io
+    _last_net_time = current_time
 
-def format_uptime():
+    return {
+        'upload_kbs': upload_kbs,
+        'download_kbs': download_kbs,
+        'upload_mbs': upload_kbs * _MB_PER_KB,
+        'download_mbs': download_kbs * _MB_PER_KB
+    }
+
+
+# Boot time is fixed for the life of the process - read it once
+_boot_time = psutil.boot_time()
+
+# Formatted uptime and the time.monotonic() time at which its minute rolls over
+_uptime_text = None
+_uptime_expires = 0.0
+
+
+def format_uptime(now=None):
     """
     Get system uptime as formatted string
 
+    The string only changes once a minute, so it is rebuilt only when the
+    displayed minute rolls over.
+
+    Args:
+        now: Current Unix timestamp (default: read the clock)
+
     Returns:
         str: Uptime formatted as "Xd Xh Xm" (e.g., "2d 5h 23m")
     """
-    try:
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
-        uptime = datetime.now() - boot_time
-        days = uptime.days
-        hours, remainder = divmod(uptime.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{days}d {hours}h {minutes}m"
-    except Exception:
-        return "0d 0h 0m"
+    global _uptime_text, _uptime_expires
+
+    # Expiry runs on the monotonic clock so wall-clock steps (NTP, DST)
+    # can't pin a stale string or expire it on every call
+    mono_now = time.monotonic()
+    if _uptime_text is not None and mono_now < _uptime_expires:
+        return _uptime_text
+
+    if now is None:
+        now = time.time()
+    uptime_seconds = max(0, int(now - _boot_time))
+    days, remainder = divmod(uptime_seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
+    _uptime_text = f"{days}d {hours}h {minutes}m"
+    _uptime_expires = mono_now + (60 - uptime_seconds % 60)
+    return _uptime_text
 
 
 def get_cpu_frequency():
@@ -666,11 +1449,27 @@ def get_cpu_frequency():
                 'cpu_freq_mhz': round(freq.current, 1),
                 'cpu_freq_ghz': round(freq.current / 1000, 2)
             }
-    except (AttributeError, NotImplementedError):
+    except (AttributeError, NotImplementedError, OSError, psutil.Error):
+        # Not supported here, or the frequency files can't be read
         pass
     return {'cpu_freq_mhz': 0, 'cpu_freq_ghz': 0}
 
 
+# Per-core metrics are reported for the first N cores only (the GUI offers
+# cpu_core_0..15); the average and count still cover every core
+MAX_CORE_METRICS = 16
+
+
+def _make_core_keys(count):
+    """Build the per-core data source keys (cpu_core_0, cpu_core_1, ...)"""
+    return tuple(f'cpu_core_{i}' for i in range(min(count, MAX_CORE_METRICS)))
+
+
+# Per-core data source keys, rebuilt only if the CPU count changes
+_core_count = psutil.cpu_count() or 0
+_core_keys = _make_core_keys(_core_count)
+
+
 def get_per_core_cpu():
     """
     Get per-core CPU usage
@@ -678,26 +1477,72 @@ def get_per_core_cpu():
     Returns:
         dict: Dictionary containing:
             - cpu_core_0, cpu_core_1, etc.: Individual core percentages
+              (first MAX_CORE_METRICS cores)
             - cpu_core_count: Number of CPU cores
             - cpu_cores_avg: Average CPU usage across all cores
     """
+    global _core_count, _core_keys, _history_keys
+
     try:
-        per_cpu = psutil.cpu_percent(percpu=True, interval=0.1)
-        result = {}
-        for i, usage in enumerate(per_cpu):
-            result[f'cpu_core_{i}'] = round(usage, 1)
-        result['cpu_core_count'] = len(per_cpu)
-        result['cpu_cores_avg'] = round(sum(per_cpu) / len(per_cpu), 1)
+        # Non-blocking: usage since the previous call (primed at import)
+        per_cpu = _read_per_cpu_percent()
+        # Count is cached - only a CPU hotplug changes it
+        if len(per_cpu) != _core_count:
+            _core_count = len(per_cpu)
+            _core_keys = _make_core_keys(_core_count)
+            _history_keys = HISTORY_SOURCES + _core_keys
+        # zip stops at the shorter key tuple - cores past the cap aren't built
+        result = {key: round(usage, 1) for key, usage in zip(_core_keys, per_cpu)}
+        result['cpu_core_count'] = _core_count
+        result['cpu_cores_avg'] = round(sum(per_cpu) / _core_count, 1)
         return result
-    except Exception:
+    except (ZeroDivisionError, OSError, psutil.Error):
+        # No per-CPU data on this platform, or /proc/stat can't be read
         return {}
 
 
-def get_disk_io_speed():
+def _find_disk_speed(node):
+    """
+    Read read/write throughput from an LHM NVMe/storage device node
+
+    Args:
+        node: Hardware node from the 'nvme' bucket
+
+    Returns:
+        dict: read_mbs and write_mbs (0.0 if not reported)
+    """
+    speeds = {'read_mbs': 0.0, 'write_mbs': 0.0}
+
+    # Look for throughput data in children
+    for child in node.get('Children', []):
+        if child.get('Text') == 'Throughput':
+            for sensor in child.get('Children', []):
+                text = sensor.get('Text', '')
+                value_str = sensor.get('Value', '0.0 KB/s')
+                try:
+                    # Parse value and convert its unit to MB/s (bare numbers are KB/s)
+                    number, _, unit = value_str.partition(' ')
+                    value = float(number) * _MBS_PER_UNIT.get(unit, 1.0)
+
+                    if 'Read' in text:
+                        speeds['read_mbs'] = max(speeds['read_mbs'], value)
+                    elif 'Write' in text:
+                        speeds['write_mbs'] = max(speeds['write_mbs'], value)
+                except ValueError:
+                    pass
+
+    return speeds
+
+
+def get_disk_io_speed(sample_time=None):
     """
     Calculate disk read/write speeds from LibreHardwareMonitor
     Falls back to psutil if LibreHardwareMonitor is unavailable
 
+    Args:
+        sample_time: time.monotonic() timestamp for the psutil delta
+                     (shared across metrics in one sample; None = now)
+
     Returns:
         dict: Dictionary containing:
             - disk_read_mbs: Read speed in MB/s
@@ -707,130 +1552,357 @@ def get_disk_io_speed():
     """
     # Try LibreHardwareMonitor first (using cached data)
     try:
-        data = _get_lhm_data()
-        if data is not None:
-            
-            # Find NVMe/disk throughput data
-            def find_disk_speed(node):
-                speeds = {'read_mbs': 0.0, 'write_mbs': 0.0}
-                
-                if isinstance(node, dict):
-                    # Check if this is an NVMe/storage device node
-                    if node.get('HardwareId', '').startswith('/nvme/'):
-                        # Look for throughput data in children
-                        for child in node.get('Children', []):
-                            if child.get('Text') == 'Throughput':
-                                for sensor in child.get('Children', []):
-                                    text = sensor.get('Text', '')
-                                    value_str = sensor.get('Value', '0.0 KB/s')
-                                    try:
-                                        # Parse value and unit
-                                        parts = value_str.split()
-                                        value = float(parts[0])
-                                        unit = parts[1] if len(parts) > 1 else 'KB/s'
-                                        
-                                        # Convert to MB/s
-                                        if 'KB/s' in unit:
-                                            value = value / 1024
-                                        elif 'GB/s' in unit:
-                                            value = value * 1024
-                                        # else already in MB/s
-                                        
-                                        if 'Read' in text:
-                                            speeds['read_mbs'] = max(speeds['read_mbs'], value)
-                                        elif 'Write' in text:
-                                            speeds['write_mbs'] = max(speeds['write_mbs'], value)
-                                    except (ValueError, IndexError):
-                                        pass
-                    
-                    # Recursively search children
-                    if 'Children' in node:
-                        for child in node['Children']:
-                            child_speeds = find_disk_speed(child)
-                            # Use the disk with the highest speeds (active disk)
-                            if child_speeds['read_mbs'] > speeds['read_mbs']:
-                                speeds['read_mbs'] = child_speeds['read_mbs']
-                            if child_speeds['write_mbs'] > speeds['write_mbs']:
-                                speeds['write_mbs'] = child_speeds['write_mbs']
-                elif isinstance(node, list):
-                    for item in node:
-                        child_speeds = find_disk_speed(item)
-                        if child_speeds['read_mbs'] > speeds['read_mbs']:
-                            speeds['read_mbs'] = child_speeds['read_mbs']
-                        if child_speeds['write_mbs'] > speeds['write_mbs']:
-                            speeds['write_mbs'] = child_speeds['write_mbs']
-                
-                return speeds
-            
-            speeds = find_disk_speed(data)
+        hardware = _get_lhm_hardware()
+        if hardware is not None:
+            speeds = {'read_mbs': 0.0, 'write_mbs': 0.0}
+            # Use the disk with the highest speeds (active disk)
+            for node in hardware['nvme']:
+                node_speeds = _find_disk_speed(node)
+                if node_speeds['read_mbs'] > speeds['read_mbs']:
+                    speeds['read_mbs'] = node_speeds['read_mbs']
+                if node_speeds['write_mbs'] > speeds['write_mbs']:
+                    speeds['write_mbs'] = node_speeds['write_mbs']
             return {
                 'disk_read_mbs': round(speeds['read_mbs'], 2),
                 'disk_write_mbs': round(speeds['write_mbs'], 2),
                 'disk_read_kbs': round(speeds['read_mbs'] * 1024, 1),
                 'disk_write_kbs': round(speeds['write_mbs'] * 1024, 1)
             }
-    except Exception:
+    except (ValueError, TypeError, AttributeError):
+        # Malformed sensor values - use psutil instead
         pass
 
     # Fallback to psutil method
     global _last_disk_io, _last_disk_io_time
 
     try:
-        import time
-        current_io = psutil.disk_io_counters()
-        current_time = time.time()
-
-        if _last_disk_io is None or _last_disk_io_time is None:
-            # First call - initialize counters
-            _last_disk_io = current_io
-            _last_disk_io_time = current_time
-            return {
-                'disk_read_mbs': 0.0,
-                'disk_write_mbs': 0.0,
-                'disk_read_kbs': 0.0,
-                'disk_write_kbs': 0.0
-            }
-
-        # Calculate time delta
-        time_delta = current_time - _last_disk_io_time
-        if time_delta == 0:
-            return {
-                'disk_read_mbs': 0.0,
-                'disk_write_mbs': 0.0,
-                'disk_read_kbs': 0.0,
-                'disk_write_kbs': 0.0
-            }
+        current_io = _read_disk_counters()
+    except (OSError, ValueError, IndexError, AttributeError):
+        # Counters unreadable, or no disks (psutil returns None)
+        return _ZERO_DISK_IO
 
-        # Calculate bytes transferred
-        bytes_read = current_io.read_bytes - _last_disk_io.read_bytes
-        bytes_write = current_io.write_bytes - _last_disk_io.write_bytes
+    current_time = sample_time if sample_time is not None else time.monotonic()
 
-        # Calculate speeds
-        read_mbs = (bytes_read / time_delta) / (1024 * 1024)
-        write_mbs = (bytes_write / time_delta) / (1024 * 1024)
-
-        # Update stored values
+    if _last_disk_io is None or _last_disk_io_time is None:
+        # First call - initialize counters
         _last_disk_io = current_io
         _last_disk_io_time = current_time
+        return _ZERO_DISK_IO
 
-        return {
-            'disk_read_mbs': round(read_mbs, 2),
-            'disk_write_mbs': round(write_mbs, 2),
-            'disk_read_kbs': round(read_mbs * 1024, 1),
-            'disk_write_kbs': round(write_mbs * 1024, 1)
-        }
-    except Exception:
-        return {
-            'disk_read_mbs': 0.0,
-            'disk_write_mbs': 0.0,
-            'disk_read_kbs': 0.0,
-            'disk_write_kbs': 0.0
-        }
+    # Calculate time delta
+    time_delta = current_time - _last_disk_io_time
+    if time_delta == 0:
+        return _ZERO_DISK_IO
+
+    # Calculate speeds in MB/s (one divide shared by both directions)
+    mbs_per_byte = 1.0 / (time_delta * 1024 * 1024)
+    read_mbs = (current_io[0] - _last_disk_io[0]) * mbs_per_byte
+    write_mbs = (current_io[1] - _last_disk_io[1]) * mbs_per_byte
+
+    # Update stored values
+    _last_disk_io = current_io
+    _last_disk_io_time = current_time
+
+    return {
+        'disk_read_mbs': round(read_mbs, 2),
+        'disk_write_mbs': round(write_mbs, 2),
+        'disk_read_kbs': round(read_mbs * 1024, 1),
+        'disk_write_kbs': round(write_mbs * 1024, 1)
+    }
+
+
+# Worker threads for the slow probes - sensors (psutil/WMI) and GPU
+# (LHM/NVML) are read from different backends, so they overlap
+_sensor_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sensors')
+
+
+def sample_slow_metrics():
+    """
+    Sample the slow-changing, expensive-to-read metrics
+
+    Returns:
+        dict: Dictionary containing:
+            - gpu: GPU metrics dict from get_gpu_usage() (None if unavailable)
+            - temps: Sensor readings from get_component_temperatures()
+            - cpu_temp: CPU temperature in Celsius (0 if unavailable)
+            - ram_temps: DIMM temperatures from get_ram_temperatures()
+            - nvme_temp: NVMe temperature in Celsius (0 if unavailable)
+    """
+    temps_future = _sensor_pool.submit(get_component_temperatures)
+    gpu_future = _sensor_pool.submit(get_gpu_usage)
+    ram_temps = _poll_cached('ram_temps', get_ram_temperatures)
+    nvme_temp = _poll_cached('nvme_temp', get_nvme_temperature)
+    temps = temps_future.result()
+    return {
+        'gpu': gpu_future.result(),
+        'temps': temps,
+        'cpu_temp': get_cpu_temperature(temps),
+        'ram_temps': ram_temps,
+        'nvme_temp': nvme_temp
+    }
+
+
+class _PeriodicWorker:
+    """Runs a callable on a background thread every `interval` seconds"""
+
+    # Prefix of the message printed when a run raises
+    error_message = "Error in background worker"
+
+    # Run once on the caller's thread before starting, so readers never see None
+    run_on_start = True
+
+    def __init__(self, interval, fn):
+        """
+        Initialize periodic worker
+
+        Args:
+            interval: Seconds between runs (0 runs back to back)
+            fn: Callable run on each tick; its result is kept as the latest data
+        """
+        self.interval = interval
+        self.fn = fn
+        self.data = None  # Result of the most recent run
+        self.run_time = 0.0  # Duration of the most recent run (seconds)
+        self.lock = threading.Lock()
+        self.start_lock = threading.Lock()
+        self.worker_thread = None
+        self.running = False
+
+    def start(self):
+        """Run once if run_on_start is set, then start the background thread"""
+        with self.start_lock:
+            if self.running:
+                return
+
+            if self.run_on_start:
+                self._run()
+            self.running = True
+            self.worker_thread = threading.Thread(target=self._run_loop, daemon=True)
+            self.worker_thread.start()
+
+    def stop(self):
+        """Stop background thread"""
+        self.running = False
+        if self.worker_thread:
+            self.worker_thread.join(timeout=2.0)
+
+    def get_latest(self):
+        """Get the result of the most recent run"""
+        with self.lock:
+            return self.data
+
+    def _run(self):
+        """Run the callable once and record its result and duration"""
+        start = time.perf_counter()
+        data = self.fn()
+        self.run_time = time.perf_counter() - start
+        with self.lock:
+            self.data = data
+
+    def _run_loop(self):
+        """Main loop (runs in background thread)"""
+        # Deadline-based pacing so run time doesn't stretch the interval
+        next_deadline = time.monotonic() + self.interval
+        while self.running:
+            sleep_time = next_deadline - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            # Skip missed deadlines after a slow run instead of bursting
+            next_deadline = max(next_deadline + self.interval, time.monotonic())
+            try:
+                self._run()
+            except Exception as e:
+                print(f"{self.error_message}: {e}")
+
+
+class SlowMetricsSampler(_PeriodicWorker):
+    """Samples slow probes on a background thread at the 'sensors' rate"""
+
+    error_message = "Error sampling slow metrics"
+
+    def __init__(self, interval=None):
+        """
+        Initialize slow metrics sampler
+
+        Args:
+            interval: Seconds to wait between samples (default: RATE_POLICY['sensors'])
+        """
+        super().__init__(RATE_POLICY['sensors'] if interval is None else interval,
+                         sample_slow_metrics)
+
+    def get_latest(self):
+        """Get the latest slow sample, starting the sampler on first use"""
+        if not self.running:
+            self.start()
+        return super().get_latest()
+
+
+_slow_sampler = SlowMetricsSampler()
+
+# Worker threads for per-collection probes that may block in the OS
+_collect_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='metrics')
+
+# Sensor name -> sanitized data source key (sensor names are stable)
+_sensor_data_keys = {}
+
+# Characters replaced by underscores in sensor data source keys
+_SENSOR_KEY_TRANSLATION = str.maketrans(' -', '__')
+
+
+def _sensor_data_key(sensor_name):
+    """
+    Get the data source key for a temperature sensor, sanitizing its name once
+
+    Args:
+        sensor_name: Sensor name from get_component_temperatures()
+
+    Returns:
+        str: Data source key (e.g., "temp_coretemp_package_id_0")
+    """
+    key = _sensor_data_keys.get(sensor_name)
+    if key is None:
+        key = 'temp_' + sensor_name.lower().translate(_SENSOR_KEY_TRANSLATION)
+        _sensor_data_keys[sensor_name] = key
+    return key
+
+
+# GPU metric defaults when no GPU data is available
+_NO_GPU_METRICS = MappingProxyType({
+    'gpu_percent': 0,
+    'gpu_memory_percent': 0,
+    'gpu_temp': 0,
+    'gpu_name': 'N/A'
+})
+
+
+# Metrics recorded for sparklines whenever present (plus per-core usage,
+# every temp_* sensor and numeric external value)
+HISTORY_SOURCES = (
+    'cpu_percent', 'ram_percent', 'ram_used', 'ram_total',
+    'gpu_percent', 'gpu_memory_percent',
+    'net_upload_mbs', 'net_download_mbs', 'net_upload_kbs', 'net_download_kbs',
+    'disk_read_mbs', 'disk_write_mbs', 'disk_c_percent',
+    'cpu_freq_mhz', 'cpu_freq_ghz', 'cpu_cores_avg',
+)
+
+# Sensor metrics recorded only while they report a reading (> 0)
+HISTORY_SENSOR_SOURCES = (
+    'cpu_temp', 'gpu_temp', 'gpu_hotspot_temp',
+    'dimm_1_temp', 'dimm_2_temp', 'dimm_3_temp', 'dimm_4_temp', 'ram_temp_avg',
+    'nvme_temp',
+    'gpu_clock', 'gpu_memory_clock', 'gpu_power', 'gpu_memory_used',
+)
+
+# HISTORY_SOURCES plus the per-core keys, rebuilt only with _core_keys
+_history_keys = HISTORY_SOURCES + _core_keys
+
+
+def _record_history(metrics, temp_metrics, external_numeric):
+    """
+    Record historical data for sparkline-enabled metrics
+
+    Args:
+        metrics: Metrics dict from get_all_metrics()
+        temp_metrics: The temp_* sensor entries of metrics
+        external_numeric: Numeric external data entries (weather, stocks, crypto)
+    """
+    # Nothing to record until a sparkline reads a history
+    if not _data_history.subscribed:
+        return
+
+    # (metric_name, value) pairs for one bulk write
+    points = [(key, metrics[key]) for key in _history_keys if key in metrics]
+    for key in HISTORY_SENSOR_SOURCES:
+        value = metrics.get(key, 0)
+        if value > 0:
+            points.append((key, value))
+
+    # All temperature sensors
+    points.extend(temp_metrics.items())
+
+    # Track external data for sparklines (weather, stocks, crypto)
+    points.extend(external_numeric.items())
+
+    # One locked write for the whole snapshot
+    _data_history.add_data_points(points)
+
+
+class HistoryRecorder(_PeriodicWorker):
+    """Records metric snapshots into DataHistory on a background thread"""
+
+    error_message = "Error recording history"
+
+    # Nothing is queued yet - the first run would block the caller
+    run_on_start = False
+
+    def __init__(self):
+        """Initialize history recorder"""
+        self.queue = queue.SimpleQueue()  # Pending _record_history() arguments
+        # Back to back: each run blocks until a snapshot is queued
+        super().__init__(0, self._record_next)
+
+    def stop(self):
+        """Stop background recording thread after draining pending snapshots"""
+        with self.start_lock:
+            if not self.running:
+                return
+        self.queue.put(None)
+        self.worker_thread.join(timeout=2.0)
+
+    def submit(self, metrics, temp_metrics, external_numeric):
+        """
+        Queue a snapshot for recording (never blocks, starts the thread if needed)
+
+        Args:
+            metrics: Metrics dict from get_all_metrics()
+            temp_metrics: The temp_* sensor entries of metrics
+            external_numeric: Numeric external data entries (weather, stocks, crypto)
+        """
+        if not self.running:
+            self.start()
+        self.queue.put((metrics, temp_metrics, external_numeric))
+
+    def _record_next(self):
+        """Record the next queued snapshot (stops the loop at the stop() marker)"""
+        snapshot = self.queue.get()
+        if snapshot is None:
+            self.running = False
+            return
+        _record_history(*snapshot)
+
+
+_history_recorder = HistoryRecorder()
+
+# Callers within one tick (collector, GUI preview, system info) share a
+# snapshot instead of each re-reading every counter
+_SNAPSHOT_TTL = 0.2  # Seconds - below the collector interval
+_snapshot = None
+_snapshot_time = 0.0
+_snapshot_lock = threading.Lock()
 
 
 def get_all_metrics():
     """
-    Get all system metrics in a single call
+    Get all system metrics in a single call.
+    Returns the previous snapshot if it is younger than _SNAPSHOT_TTL, so
+    concurrent callers don't split counter deltas or record history twice.
+
+    Returns:
+        dict: See _collect_all_metrics()
+    """
+    global _snapshot, _snapshot_time
+
+    with _snapshot_lock:
+        now = time.monotonic()
+        if _snapshot is None or now - _snapshot_time >= _SNAPSHOT_TTL:
+            _snapshot = _collect_all_metrics()
+            _snapshot_time = now
+        return _snapshot
+
+
+def _collect_all_metrics():
+    """
+    Collect a fresh snapshot of all system metrics
 
     Returns:
         dict: Dictionary containing all metrics:
@@ -865,30 +1937,42 @@ def get_all_metrics():
             - uptime: System uptime formatted string
             - hostname: System hostname
     """
-    ram = get_ram_usage()
-    disk = get_disk_usage()
-    gpu = get_gpu_usage()
-    network = get_network_speed()
-    temps = get_component_temperatures()
-    cpu_freq = get_cpu_frequency()
+    ram = _poll_cached('ram', get_ram_usage)
+    disk = _poll_cached('disk', get_disk_usage)
+    # One timestamp for all counter deltas so rates cover the same window
+    sample_time = time.monotonic()
+    # Network and disk I/O reads can block (LHM HTTP, Windows disk counters),
+    # so overlap them with each other and with the probes below
+    network_future = _collect_pool.submit(get_network_speed, sample_time)
+    disk_io_future = _collect_pool.submit(get_disk_io_speed, sample_time)
+    cpu_freq = _poll_cached('cpu_freq', get_cpu_frequency)
     per_core = get_per_core_cpu()
-    disk_io = get_disk_io_speed()
-    ram_temps = get_ram_temperatures()
-    nvme_temp = get_nvme_temperature()
+    network = network_future.result()
+    disk_io = disk_io_future.result()
+
+    # Slow probes are sampled on a background thread - never block on them here
+    slow = _slow_sampler.get_latest()
+    gpu = slow['gpu']
+    temps = slow['temps']
+    ram_temps = slow['ram_temps']
+    nvme_temp = slow['nvme_temp']
+
+    # Single timestamp for every clock-derived field in this sample
+    now_ts = time.time()
+    now = time.localtime(now_ts)
 
     metrics = {
-        'cpu_percent': get_cpu_usage(),
-        'cpu_name': 'Intel core i7-14700',  # Static name for CPU
-        'ram_used': ram['used'],
-        'ram_total': ram['total'],
-        'ram_percent': ram['percent'],
-        'ram_name': 'XPG Lancer DDR5 6400MHz',  # Generic name for RAM
-        'time': get_current_time(),
-        'date': datetime.now().strftime('%a, %b %d'),
-        'disk_c_used': disk['used'],
-        'disk_c_total': disk['total'],
-        'disk_c_percent': disk['percent'],
-        'disk_name': 'Samsung SSD 990 PRO 2TB',  # Example static name
+        # Derived from the per-core sample so CPU usage is sampled only once
+        'cpu_percent': per_core['cpu_cores_avg'] if per_core else get_cpu_usage(),
+        'cpu_name': get_cpu_name(),  # Resolved once in the background
+        'ram_used': ram.used,
+        'ram_total': ram.total,
+        'ram_percent': ram.percent,
+        'time': get_current_time(now=now),
+        'date': _format_date(now),
+        'disk_c_used': disk.used,
+        'disk_c_total': disk.total,
+        'disk_c_percent': disk.percent,
 
         # Network speeds
         'net_upload_kbs': network['upload_kbs'],
@@ -896,187 +1980,33 @@ def get_all_metrics():
         'net_upload_mbs': network['upload_mbs'],
         'net_download_mbs': network['download_mbs'],
         # System info
-        'uptime': format_uptime(),
-        'hostname': socket.gethostname()
+        'uptime': format_uptime(now_ts),
+        # RAM/disk names and hostname
+        **_STATIC_METRICS,
+
+        # CPU frequency, per-core CPU, disk I/O speeds and RAM temperatures
+        **cpu_freq,
+        **per_core,
+        **disk_io,
+        **ram_temps,
+        'nvme_temp': nvme_temp,
+
+        # GPU metrics (keys match metric names), defaults when GPU not available
+        **(gpu if gpu else _NO_GPU_METRICS),
+        'cpu_temp': slow['cpu_temp']
     }
 
-    # Add CPU frequency metrics
-    metrics.update(cpu_freq)
-
-    # Add per-core CPU metrics
-    metrics.update(per_core)
-
-    # Add disk I/O speeds
-    metrics.update(disk_io)
-
-    # Add RAM temperatures
-    metrics.update(ram_temps)
-    
-    # Add NVMe temperature
-    metrics['nvme_temp'] = nvme_temp
-
-    # Add GPU metrics if available
-    if gpu:
-        metrics.update({
-            'gpu_percent': gpu['gpu_percent'],
-            'gpu_memory_percent': gpu['gpu_memory_percent'],
-            'gpu_temp': gpu['gpu_temp'],
-            'gpu_name': gpu['gpu_name']
-        })
-        # Add optional GPU metrics if available
-        if 'gpu_hotspot_temp' in gpu:
-            metrics['gpu_hotspot_temp'] = gpu['gpu_hotspot_temp']
-        if 'gpu_clock' in gpu:
-            metrics['gpu_clock'] = gpu['gpu_clock']
-        if 'gpu_memory_clock' in gpu:
-            metrics['gpu_memory_clock'] = gpu['gpu_memory_clock']
-        if 'gpu_power' in gpu:
-            metrics['gpu_power'] = gpu['gpu_power']
-        if 'gpu_memory_used' in gpu:
-            metrics['gpu_memory_used'] = gpu['gpu_memory_used']
-        if 'gpu_memory_total' in gpu:
-            metrics['gpu_memory_total'] = gpu['gpu_memory_total']
-    else:
-        # Default values when GPU not available
-        metrics.update({
-            'gpu_percent': 0,
-            'gpu_memory_percent': 0,
-            'gpu_temp': 0,
-            'gpu_name': 'N/A'
-        })
-
-    # Add CPU temperature if available
-    cpu_temp = 0
-    
-    # Try LibreHardwareMonitor web server first (most reliable on Windows)
-    cpu_temp = get_cpu_temp_from_libre_hardware_monitor()
-    
-    # If that didn't work, try psutil sensors (Linux/Mac)
-    if cpu_temp == 0:
-        for key, value in temps.items():
-            # Look for CPU temperature sensors (varies by platform)
-            if any(keyword in key.lower() for keyword in ['coretemp', 'cpu', 'k10temp', 'zenpower']):
-                cpu_temp = value
-                break
-    
-    # Last resort: try WMI methods (rarely work)
-    if cpu_temp == 0:
-        try:
-            import wmi
-            # Try OpenHardwareMonitor namespace
-            try:
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                temperature_infos = w.Sensor()
-                for sensor in temperature_infos:
-                    if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                        cpu_temp = float(sensor.Value)
-                        break
-            except:
-                pass
-            
-            # Try LibreHardwareMonitor namespace
-            if cpu_temp == 0:
-                try:
-                    w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-                    temperature_infos = w.Sensor()
-                    for sensor in temperature_infos:
-                        if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                            cpu_temp = float(sensor.Value)
-                            break
-                except:
-                    pass
-        except:
-            pass
-    
-    metrics['cpu_temp'] = cpu_temp
-
     # Expose all temperature sensors as data sources
-    for sensor_name, temp_value in temps.items():
-        # Sanitize sensor name for use as data source key
-        clean_name = sensor_name.lower().replace(' ', '_').replace('-', '_')
-        metrics[f'temp_{clean_name}'] = round(temp_value, 1)
-
-    # Record historical data for sparkline-enabled metrics
-    # Core metrics
-    _data_history.add_data_point('cpu_percent', metrics['cpu_percent'])
-    _data_history.add_data_point('ram_percent', metrics['ram_percent'])
-    _data_history.add_data_point('ram_used', metrics['ram_used'])
-    _data_history.add_data_point('ram_total', metrics['ram_total'])
-    _data_history.add_data_point('gpu_percent', metrics['gpu_percent'])
-    _data_history.add_data_point('gpu_memory_percent', metrics['gpu_memory_percent'])
-    
-    # Network
-    _data_history.add_data_point('net_upload_mbs', metrics['net_upload_mbs'])
-    _data_history.add_data_point('net_download_mbs', metrics['net_download_mbs'])
-    _data_history.add_data_point('net_upload_kbs', metrics['net_upload_kbs'])
-    _data_history.add_data_point('net_download_kbs', metrics['net_download_kbs'])
-    
-    # Disk
-    _data_history.add_data_point('disk_read_mbs', metrics['disk_read_mbs'])
-    _data_history.add_data_point('disk_write_mbs', metrics['disk_write_mbs'])
-    _data_history.add_data_point('disk_c_percent', metrics['disk_c_percent'])
-    
-    # CPU frequency and per-core (if available)
-    if 'cpu_freq_mhz' in metrics:
-        _data_history.add_data_point('cpu_freq_mhz', metrics['cpu_freq_mhz'])
-        _data_history.add_data_point('cpu_freq_ghz', metrics['cpu_freq_ghz'])
-    
-    # Per-core CPU (track up to 16 cores)
-    for i in range(16):
-        core_key = f'cpu_core_{i}'
-        if core_key in metrics:
-            _data_history.add_data_point(core_key, metrics[core_key])
-    
-    if 'cpu_cores_avg' in metrics:
-        _data_history.add_data_point('cpu_cores_avg', metrics['cpu_cores_avg'])
-    
-    # Temperatures
-    if metrics['cpu_temp'] > 0:
-        _data_history.add_data_point('cpu_temp', metrics['cpu_temp'])
-    if metrics['gpu_temp'] > 0:
-        _data_history.add_data_point('gpu_temp', metrics['gpu_temp'])
-    if 'gpu_hotspot_temp' in metrics and metrics['gpu_hotspot_temp'] > 0:
-        _data_history.add_data_point('gpu_hotspot_temp', metrics['gpu_hotspot_temp'])
-    
-    # RAM temperatures
-    if metrics.get('dimm_1_temp', 0) > 0:
-        _data_history.add_data_point('dimm_1_temp', metrics['dimm_1_temp'])
-    if metrics.get('dimm_2_temp', 0) > 0:
-        _data_history.add_data_point('dimm_2_temp', metrics['dimm_2_temp'])
-    if metrics.get('dimm_3_temp', 0) > 0:
-        _data_history.add_data_point('dimm_3_temp', metrics['dimm_3_temp'])
-    if metrics.get('dimm_4_temp', 0) > 0:
-        _data_history.add_data_point('dimm_4_temp', metrics['dimm_4_temp'])
-    if metrics.get('ram_temp_avg', 0) > 0:
-        _data_history.add_data_point('ram_temp_avg', metrics['ram_temp_avg'])
-    
-    # NVMe temperature
-    if metrics.get('nvme_temp', 0) > 0:
-        _data_history.add_data_point('nvme_temp', metrics['nvme_temp'])
-    
-    # GPU clocks and power
-    if 'gpu_clock' in metrics and metrics['gpu_clock'] > 0:
-        _data_history.add_data_point('gpu_clock', metrics['gpu_clock'])
-    if 'gpu_memory_clock' in metrics and metrics['gpu_memory_clock'] > 0:
-        _data_history.add_data_point('gpu_memory_clock', metrics['gpu_memory_clock'])
-    if 'gpu_power' in metrics and metrics['gpu_power'] > 0:
-        _data_history.add_data_point('gpu_power', metrics['gpu_power'])
-    if 'gpu_memory_used' in metrics and metrics['gpu_memory_used'] > 0:
-        _data_history.add_data_point('gpu_memory_used', metrics['gpu_memory_used'])
-    
-    # All temperature sensors
-    for key, value in metrics.items():
-        if key.startswith('temp_') and isinstance(value, (int, float)):
-            _data_history.add_data_point(key, value)
+    temp_metrics = {_sensor_data_key(sensor_name): round(temp_value, 1)
+                    for sensor_name, temp_value in temps.items()}
+    metrics.update(temp_metrics)
 
     # Add external data if available
     external_data = _external_data_manager.get_data()
     metrics.update(external_data)
-    
-    # Track external data for sparklines (weather, stocks, crypto)
-    for key, value in external_data.items():
-        if isinstance(value, (int, float)):
-            _data_history.add_data_point(key, value)
+
+    # Record sparkline history on the recorder thread
+    _history_recorder.submit(metrics, temp_metrics, _external_data_manager.get_numeric_data())
 
     return metrics
 
@@ -1112,11 +2042,38 @@ def stop_external_data():
     _external_data_manager.stop()
 
 
+class MetricsCollector(_PeriodicWorker):
+    """Collects metrics on a background thread so readers never block on psutil"""
+
+    error_message = "Error collecting metrics"
+
+    def __init__(self, interval=0.25):
+        """
+        Initialize metrics collector
+
+        Args:
+            interval: Seconds to wait between collections
+        """
+        super().__init__(interval, get_all_metrics)
+
+    @property
+    def collect_time(self):
+        """Duration of the most recent collection (seconds)"""
+        return self.run_time
+
+    def start(self):
+        """Collect an initial snapshot, then start the background thread"""
+        # Overlap the slow CPU name lookup with the initial collection
+        _start_cpu_name_lookup()
+        super().start()
+
+
 # For testing
 if __name__ == "__main__":
     print("System Metrics Test")
     print("=" * 50)
 
+    wait_for_cpu_name()
     metrics = get_all_metrics()
 
     print(f"Time: {metrics['time']}")
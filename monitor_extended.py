@@ -4,18 +4,20 @@ Collects comprehensive system metrics including disk, network, temps
 """
 
 import psutil
+import time
 from datetime import datetime
 import platform
 
-
-def get_cpu_usage():
-    """Get CPU usage percentage"""
-    return psutil.cpu_percent(interval=0.1)
+import monitor
+# Shared with monitor.py (which also primes psutil's CPU counters at import).
+# RAM and disk usage are UsageInfo(used, total, percent) tuples in GB.
+from monitor import get_cpu_usage, get_ram_usage, get_disk_usage
 
 
 def get_cpu_per_core():
-    """Get per-core CPU usage"""
-    return psutil.cpu_percent(interval=0.1, percpu=True)
+    """Get per-core CPU usage since the previous call (non-blocking, call at
+    intervals of at least 200 ms for a meaningful reading)"""
+    return psutil.cpu_percent(interval=None, percpu=True)
 
 
 def get_cpu_freq():
@@ -30,31 +32,6 @@ def get_cpu_freq():
     return None
 
 
-def get_ram_usage():
-    """Get RAM usage"""
-    mem = psutil.virtual_memory()
-    return {
-        'used': mem.used / (1024 ** 3),
-        'total': mem.total / (1024 ** 3),
-        'percent': mem.percent,
-        'available': mem.available / (1024 ** 3)
-    }
-
-
-def get_disk_usage():
-    """Get disk usage for C: drive"""
-    try:
-        disk = psutil.disk_usage('C:')
-        return {
-            'used': disk.used / (1024 ** 3),
-            'total': disk.total / (1024 ** 3),
-            'percent': disk.percent,
-            'free': disk.free / (1024 ** 3)
-        }
-    except:
-        return None
-
-
 def get_disk_io():
     """Get disk I/O stats"""
     try:
@@ -85,17 +62,26 @@ def get_network_usage():
         return None
 
 
+# Previous network sample for speed calculation
+_last_net = None
+_last_net_time = None
+
+
 def get_network_speed():
-    """Get current network speed (approximate)"""
+    """Get current network speed since the previous call (non-blocking)"""
+    global _last_net, _last_net_time
+
     try:
-        # Take two samples
-        net1 = psutil.net_io_counters()
-        import time
-        time.sleep(0.5)
-        net2 = psutil.net_io_counters()
+        net = psutil.net_io_counters()
+        now = time.monotonic()
 
-        upload_speed = (net2.bytes_sent - net1.bytes_sent) * 2 / 1024  # KB/s
-        download_speed = (net2.bytes_recv - net1.bytes_recv) * 2 / 1024  # KB/s
+        # First call (or no time elapsed): report zero speed
+        upload_speed = download_speed = 0.0
+        if _last_net is not None and now > _last_net_time:
+            dt = now - _last_net_time
+            upload_speed = (net.bytes_sent - _last_net.bytes_sent) / dt / 1024  # KB/s
+            download_speed = (net.bytes_recv - _last_net.bytes_recv) / dt / 1024  # KB/s
+        _last_net, _last_net_time = net, now
 
         return {
             'upload_kbps': upload_speed,
@@ -147,15 +133,18 @@ def get_date(format_str="%Y-%m-%d"):
     return datetime.now().strftime(format_str)
 
 
+# Boot time never changes while the process runs - read it once
+_boot_time = psutil.boot_time()
+
+
 def get_uptime():
     """Get system uptime"""
     try:
-        boot_time = psutil.boot_time()
-        uptime_seconds = datetime.now().timestamp() - boot_time
+        uptime_seconds = time.time() - _boot_time
 
-        days = int(uptime_seconds // 86400)
-        hours = int((uptime_seconds % 86400) // 3600)
-        minutes = int((uptime_seconds % 3600) // 60)
+        days, remainder = divmod(int(uptime_seconds), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes = remainder // 60
 
         return {
             'seconds': uptime_seconds,
@@ -181,23 +170,14 @@ def get_system_info():
 
 def get_all_metrics():
     """Get all available metrics"""
-    ram = get_ram_usage()
-    disk = get_disk_usage()
+    # Reuse monitor.py's shared snapshot instead of sampling everything twice
+    metrics = dict(monitor.get_all_metrics())
     net = get_network_usage()
 
-    metrics = {
-        'cpu_percent': get_cpu_usage(),
-        'ram_used': ram['used'],
-        'ram_total': ram['total'],
-        'ram_percent': ram['percent'],
-        'time': get_current_time()
-    }
-
-    # Add disk if available
-    if disk:
-        metrics['disk_used'] = disk['used']
-        metrics['disk_total'] = disk['total']
-        metrics['disk_percent'] = disk['percent']
+    # Disk aliases for the C: drive
+    metrics['disk_used'] = metrics['disk_c_used']
+    metrics['disk_total'] = metrics['disk_c_total']
+    metrics['disk_percent'] = metrics['disk_c_percent']
 
     # Add network if available
     if net:
@@ -220,12 +200,12 @@ if __name__ == "__main__":
 
     print("\n[RAM]")
     ram = get_ram_usage()
-    print(f"Usage: {ram['used']:.2f} / {ram['total']:.2f} GB ({ram['percent']:.1f}%)")
+    print(f"Usage: {ram.used:.2f} / {ram.total:.2f} GB ({ram.percent:.1f}%)")
 
     print("\n[Disk]")
     disk = get_disk_usage()
-    if disk:
-        print(f"C: {disk['used']:.1f} / {disk['total']:.1f} GB ({disk['percent']:.1f}%)")
+    if disk.total:
+        print(f"C: {disk.used:.1f} / {disk.total:.1f} GB ({disk.percent:.1f}%)")
 
     print("\n[Network]")
     net = get_network_usage()
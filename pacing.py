@@ -0,0 +1,32 @@
+"""
+Frame Pacing for the Display Update Loops
+Schedules frames against fixed deadlines on a monotonic clock
+"""
+
+import time
+
+
+class FramePacer:
+    """Sleeps each frame until its deadline (no drift, immune to NTP jumps)"""
+
+    def __init__(self, period):
+        """
+        Initialize frame pacer
+
+        Args:
+            period: Target frame period in seconds
+        """
+        self.period = period
+        self.next_deadline = time.perf_counter() + period
+
+    def wait(self):
+        """Sleep until the next frame deadline and schedule the one after it"""
+        sleep_time = self.next_deadline - time.perf_counter()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+        self.next_deadline += self.period
+
+        # Catch up after a slow frame instead of firing a burst of frames
+        now = time.perf_counter()
+        if self.next_deadline < now:
+            self.next_deadline = now + self.period
@@ -3,8 +3,10 @@ Renderer Module
 Creates 320x480 dashboard images using Pillow with configurable widget layouts
 """
 
+import io
 import json
 import os
+import time
 from PIL import Image, ImageDraw
 import widgets
 import config as cfg
@@ -134,6 +136,21 @@ class Renderer:
 
         return image
 
+    def data_fingerprint(self, data):
+        """
+        Fingerprint the values this layout displays
+
+        Values are hashed as-is: widgets format them at different precisions
+        (and some show str(value)), so any change may be visible.
+
+        Args:
+            data: System metrics dictionary
+
+        Returns:
+            int: Hash of every widget's relevant data
+        """
+        return hash(str([widget.get_relevant_data(data) for widget in self.widget_instances]))
+
     def render_incremental(self, data, force_full=False):
         """
         Render only changed regions for faster updates.
@@ -145,8 +162,7 @@ class Renderer:
         Returns:
             list: Dirty regions [{'x', 'y', 'width', 'height', 'image'}]
         """
-        import time
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Force full render on first call or explicit request
         if self._background_cache is None or force_full:
@@ -241,7 +257,6 @@ class Renderer:
         Returns:
             bytes: Image data
         """
-        import io
         image = self.render(data)
         buffer = io.BytesIO()
         image.save(buffer, format=format)
@@ -4,6 +4,7 @@ Test different baud rates to find the optimal speed
 import time
 import json
 import serial
+from PIL import Image, ImageChops
 
 print("=" * 60)
 print("BAUD RATE PERFORMANCE TEST")
@@ -35,6 +36,31 @@ print(f"Data size: {image.size[0] * image.size[1] * 2 + 6} bytes")
 print()
 print("=" * 60)
 
+# Convert image to RGB565 once - the same frame is sent in every trial
+rgb = image.convert('RGB')
+width, height = image.size
+# Pack big-endian RRRRRGGG GGGBBBBB pixels with Pillow band operations
+# (the bit fields don't overlap, so adding the bands is a bitwise OR)
+r, g, b = rgb.split()
+high = ImageChops.add(r.point(lambda v: v & 0xF8), g.point(lambda v: v >> 5))
+low = ImageChops.add(g.point(lambda v: (v << 3) & 0xE0), b.point(lambda v: v >> 3))
+rgb565_data = Image.merge('LA', (high, low)).tobytes()
+
+# Build header
+x_pos = 0
+y_pos = 0
+ex = x_pos + width - 1
+ey = y_pos + height - 1
+
+header = bytearray(6)
+header[0] = x_pos >> 2
+header[1] = ((x_pos & 3) << 6) + (y_pos >> 4)
+header[2] = ((y_pos & 15) << 4) + (ex >> 6)
+header[3] = ((ex & 63) << 2) + (ey >> 8)
+header[4] = ey & 255
+header[5] = 197  # DISPLAY_BITMAP command
+header = bytes(header)
+
 results = []
 
 for baud_rate in BAUD_RATES:
@@ -60,44 +86,13 @@ for baud_rate in BAUD_RATES:
         # Test sending image 3 times
         times = []
         for i in range(3):
-            # Convert image to RGB565
-            rgb = image.convert('RGB')
-            pixels = rgb.load()
-            width, height = image.size
-            rgb565_data = bytearray(width * height * 2)
-            idx = 0
-            for y in range(height):
-                for x in range(width):
-                    r, g, b = pixels[x, y]
-                    r5 = (r >> 3) & 0x1F
-                    g6 = (g >> 2) & 0x3F
-                    b5 = (b >> 3) & 0x1F
-                    rgb565 = (r5 << 11) | (g6 << 5) | b5
-                    rgb565_data[idx] = (rgb565 >> 8) & 0xFF
-                    rgb565_data[idx + 1] = rgb565 & 0xFF
-                    idx += 2
-            
-            # Build header
-            x_pos = 0
-            y_pos = 0
-            ex = x_pos + width - 1
-            ey = y_pos + height - 1
-            
-            header = bytearray(6)
-            header[0] = x_pos >> 2
-            header[1] = ((x_pos & 3) << 6) + (y_pos >> 4)
-            header[2] = ((y_pos & 15) << 4) + (ex >> 6)
-            header[3] = ((ex & 63) << 2) + (ey >> 8)
-            header[4] = ey & 255
-            header[5] = 197  # DISPLAY_BITMAP command
-            
             # Time the send operation
-            start = time.time()
+            start = time.perf_counter()
             ser.write(header)
             time.sleep(0.001)
             ser.write(rgb565_data)
             ser.flush()
-            elapsed = (time.time() - start) * 1000
+            elapsed = (time.perf_counter() - start) * 1000
             times.append(elapsed)
             
             print(f"  Attempt {i+1}: {elapsed:.0f}ms")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for DataHistory subscriptions and history reads
+"""
+
+import sys
+
+# Add project directory to path
+sys.path.insert(0, '.')
+
+from data_history import DataHistory
+
+
+def test_unsubscribed_metric_is_not_recorded():
+    history = DataHistory(max_points=5)
+    history.add_data_points([('cpu_percent', 10)])
+    assert history.get_tracked_metrics() == []
+    assert history.get_history('cpu_percent') == []
+
+
+def test_subscribed_metric_is_recorded():
+    history = DataHistory(max_points=5)
+    history.get_history('cpu_percent')  # A sparkline reads it
+    history.add_data_points([('cpu_percent', 10), ('ram_percent', 20)])
+    assert history.get_history('cpu_percent') == [10.0]
+    assert history.get_tracked_metrics() == ['cpu_percent']
+
+
+def test_get_history_returns_last_points_in_order():
+    history = DataHistory(max_points=5)
+    history.get_history('cpu_percent')
+    for value in range(8):
+        history.add_data_points([('cpu_percent', value)])
+    assert history.get_history('cpu_percent') == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert history.get_history('cpu_percent', num_points=3) == [5.0, 6.0, 7.0]
+    assert history.get_history('cpu_percent', num_points=10) == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"{name}: OK")
@@ -39,9 +39,9 @@ def test_incremental_rendering():
     full_times = []
     for i in range(5):
         data = get_all_metrics()
-        start = time.time()
+        start = time.perf_counter()
         image = renderer.render(data)
-        elapsed = (time.time() - start) * 1000
+        elapsed = (time.perf_counter() - start) * 1000
         full_times.append(elapsed)
         print(f"  Full render {i+1}: {elapsed:.1f}ms")
 
@@ -61,9 +61,9 @@ def test_incremental_rendering():
         widget._is_dirty = True
 
     data = get_all_metrics()
-    start = time.time()
+    start = time.perf_counter()
     regions = renderer.render_incremental(data, force_full=True)
-    elapsed = (time.time() - start) * 1000
+    elapsed = (time.perf_counter() - start) * 1000
 
     print(f"  Time: {elapsed:.1f}ms")
     print(f"  Regions: {len(regions)}")
@@ -86,9 +86,9 @@ def test_incremental_rendering():
         time.sleep(0.1)
         data = get_all_metrics()
 
-        start = time.time()
+        start = time.perf_counter()
         regions = renderer.render_incremental(data, force_full=False)
-        elapsed = (time.time() - start) * 1000
+        elapsed = (time.perf_counter() - start) * 1000
 
         total_pixels = sum(r['width'] * r['height'] for r in regions)
 
@@ -167,7 +167,7 @@ def test_widget_dirty_tracking():
     print("-" * 70)
 
     data = get_all_metrics()
-    current_time = time.time()
+    current_time = time.monotonic()
 
     for widget in renderer.widget_instances:
         needs = widget.needs_update(data, current_time)
@@ -181,7 +181,7 @@ def test_widget_dirty_tracking():
     # Small delay to allow data to potentially change
     time.sleep(0.5)
     data = get_all_metrics()
-    current_time = time.time()
+    current_time = time.monotonic()
 
     for widget in renderer.widget_instances:
         needs = widget.needs_update(data, current_time)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the LibreHardwareMonitor tree index in monitor.py
+Uses the captured data.json in libremonitoroutput.json (i7-14700 + RTX 4060)
+"""
+
+import ast
+import os
+import sys
+
+# Add project directory to path
+sys.path.insert(0, '.')
+
+import monitor
+
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libremonitoroutput.json')
+
+# The capture is a Python repr (single quotes), not strict JSON
+with open(SAMPLE_PATH, 'r', encoding='utf-8') as f:
+    SAMPLE = ast.literal_eval(f.read())
+
+INDEX = monitor._index_lhm_tree(SAMPLE)
+
+
+def test_buckets_group_hardware_in_tree_order():
+    assert [node['Text'] for node in INDEX['gpu']] == [
+        'NVIDIA GeForce RTX 4060', 'Intel(R) UHD Graphics 770', 'Intel(R) UHD Graphics 770']
+    assert [node['HardwareId'] for node in INDEX['cpu']] == ['/intelcpu/0']
+    assert [node['HardwareId'] for node in INDEX['memory']] == ['/memory/dimm/1', '/memory/dimm/3']
+    assert [node['Text'] for node in INDEX['nvme']] == ['Samsung SSD 990 PRO 2TB']
+    assert len(INDEX['nic']) == 7
+    assert INDEX['nic'][1]['Text'] == 'Ethernet'
+
+
+def test_gpu_readings():
+    gpu = monitor._find_gpu_data(INDEX['gpu'][0])
+    assert gpu['gpu_name'] == 'NVIDIA GeForce RTX 4060'
+    assert gpu['gpu_temp'] == 39.0
+    assert gpu['gpu_hotspot_temp'] == 45.4
+    assert gpu['gpu_memory_percent'] == 2.0
+    assert gpu['gpu_clock'] == 2595.0
+    assert gpu['gpu_memory_total'] == 8188.0
+
+
+def test_cpu_and_nvme_temperatures():
+    assert monitor._find_cpu_temp(INDEX['cpu'][0]) == 40.8
+    assert monitor._find_nvme_temp(INDEX['nvme'][0]) == 40.0
+
+
+def test_network_and_disk_throughput():
+    speeds = [monitor._find_network_speed(node) for node in INDEX['nic']]
+    assert speeds[3] == {'upload_kbs': 3.9, 'download_kbs': 3.3}
+    assert monitor._find_disk_speed(INDEX['nvme'][0]) == {'read_mbs': 0.0, 'write_mbs': 5.7}
+
+
+def test_ram_temperatures_from_memory_bucket():
+    saved = monitor._get_lhm_hardware
+    monitor._get_lhm_hardware = lambda: INDEX
+    try:
+        temps = monitor.get_ram_temperatures()
+    finally:
+        monitor._get_lhm_hardware = saved
+    assert temps == {'dimm_1_temp': 44.3, 'dimm_2_temp': 0, 'dimm_3_temp': 44.3,
+                     'dimm_4_temp': 0, 'ram_temp_avg': 44.3}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"{name}: OK")
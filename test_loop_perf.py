@@ -12,12 +12,12 @@ print()
 
 # Import modules
 print("Importing modules...")
-start = time.time()
+start = time.perf_counter()
 from monitor import get_all_metrics
 from renderer import Renderer
 from device_manager import TuringDisplay
 import config as cfg
-import_time = (time.time() - start) * 1000
+import_time = (time.perf_counter() - start) * 1000
 print(f"Import time: {import_time:.0f}ms\n")
 
 # Load layout
@@ -64,29 +64,29 @@ times = {
 }
 
 for i in range(10):
-    loop_start = time.time()
+    loop_start = time.perf_counter()
     
     # 1. Get metrics
-    t1 = time.time()
+    t1 = time.perf_counter()
     metrics = get_all_metrics()
-    metrics_time = (time.time() - t1) * 1000
+    metrics_time = (time.perf_counter() - t1) * 1000
     times['get_metrics'].append(metrics_time)
     
     # 2. Render
-    t2 = time.time()
+    t2 = time.perf_counter()
     image = renderer.render(metrics)
-    render_time = (time.time() - t2) * 1000
+    render_time = (time.perf_counter() - t2) * 1000
     times['render'].append(render_time)
     
     # 3. Display (if connected)
-    t3 = time.time()
+    t3 = time.perf_counter()
     if device_connected:
         display.display_image(image)
-    display_time = (time.time() - t3) * 1000
+    display_time = (time.perf_counter() - t3) * 1000
     times['display'].append(display_time)
     
     # Total
-    total_time = (time.time() - loop_start) * 1000
+    total_time = (time.perf_counter() - loop_start) * 1000
     times['total'].append(total_time)
     
     print(f"Cycle {i+1:2d}: Metrics={metrics_time:5.0f}ms  Render={render_time:4.0f}ms  Display={display_time:5.0f}ms  Total={total_time:6.0f}ms")
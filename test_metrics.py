@@ -8,9 +8,9 @@ print("=" * 60)
 
 # Import after print to see any import slowness
 print("\nImporting monitor module...")
-import_start = time.time()
+import_start = time.perf_counter()
 import monitor
-print(f"Import took: {(time.time()-import_start)*1000:.0f}ms")
+print(f"Import took: {(time.perf_counter()-import_start)*1000:.0f}ms")
 
 print("\n--- Individual function timings ---\n")
 
@@ -32,13 +32,13 @@ funcs_to_test = [
 ]
 
 for name, func in funcs_to_test:
-    start = time.time()
+    start = time.perf_counter()
     try:
         result = func()
-        elapsed = (time.time() - start) * 1000
+        elapsed = (time.perf_counter() - start) * 1000
         status = "OK"
     except Exception as e:
-        elapsed = (time.time() - start) * 1000
+        elapsed = (time.perf_counter() - start) * 1000
         status = f"ERROR: {e}"
     
     if elapsed > 100:
@@ -49,9 +49,9 @@ for name, func in funcs_to_test:
 
 # Now test the full function
 print("\n--- Full get_all_metrics() ---\n")
-start = time.time()
+start = time.perf_counter()
 data = monitor.get_all_metrics()
-print(f"get_all_metrics(): {(time.time()-start)*1000:.0f}ms")
+print(f"get_all_metrics(): {(time.perf_counter()-start)*1000:.0f}ms")
 
 print("\n" + "=" * 60)
 print("DONE")
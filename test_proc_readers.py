@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the Linux /proc counter parsers in monitor.py
+Feeds fixed /proc text so results don't depend on the machine
+"""
+
+import sys
+
+# Add project directory to path
+sys.path.insert(0, '.')
+
+import monitor
+
+
+NET_DEV = b"""\
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:  1000      10    0    0    0     0          0         0     1000      10    0    0    0     0       0          0
+  eth0: 500000    400    0    0    0     0          0         0   250000     300    0    0    0     0       0          0
+ wlan0:  20000     40    0    0    0     0          0         0     3000      20    0    0    0     0       0          0
+"""
+
+DISKSTATS = b"""\
+ 259       0 nvme0n1 5000 10 8000 900 2000 20 4000 700 0 1000 1600 0 0 0 0 0 0
+ 259       1 nvme0n1p1 4000 10 6000 800 1500 20 3000 600 0 900 1400 0 0 0 0 0 0
+   8       0 sda 100 0 200 10 50 0 100 5 0 15 15 0 0 0 0 0 0
+"""
+
+MEMINFO = b"""\
+MemTotal:        8000000 kB
+MemFree:         1000000 kB
+MemAvailable:    6000000 kB
+Buffers:          200000 kB
+"""
+
+STAT = b"""\
+cpu  400 0 200 1200 200 0 0 0 0 0
+cpu0 300 0 100 500 100 0 0 0 0 0
+cpu1 100 0 100 700 100 0 0 0 0 0
+intr 12345 0 0
+ctxt 67890
+"""
+
+STAT_LATER = b"""\
+cpu  650 0 300 1650 200 0 0 0 0 0
+cpu0 550 0 150 600 100 0 0 0 0 0
+cpu1 100 0 150 1050 100 0 0 0 0 0
+intr 23456 0 0
+ctxt 78901
+"""
+
+
+def test_net_dev_sums_all_interfaces():
+    """All interfaces count, loopback included, like psutil.net_io_counters()"""
+    sent, recv = monitor._parse_net_dev(NET_DEV)
+    assert sent == 1000 + 250000 + 3000
+    assert recv == 1000 + 500000 + 20000
+
+
+def test_diskstats_counts_whole_disks_only():
+    """Partitions are skipped and sectors are 512 bytes"""
+    saved = dict(monitor._whole_disks)
+    monitor._whole_disks.update({b'nvme0n1': True, b'nvme0n1p1': False, b'sda': True})
+    try:
+        read, write = monitor._parse_diskstats(DISKSTATS)
+    finally:
+        monitor._whole_disks.clear()
+        monitor._whole_disks.update(saved)
+    assert read == (8000 + 200) * 512
+    assert write == (4000 + 100) * 512
+
+
+def test_meminfo_used_is_total_minus_available():
+    used, total, percent = monitor._parse_meminfo(MEMINFO)
+    assert total == 8000000 * 1024
+    assert used == 2000000 * 1024
+    assert percent == 25.0
+
+
+def test_meminfo_without_available_falls_back():
+    """Kernels without MemAvailable leave it to psutil"""
+    assert monitor._parse_meminfo(b"MemTotal: 8000000 kB\nMemFree: 1000000 kB\n") is None
+
+
+def test_stat_reads_per_cpu_lines_only():
+    """The aggregate line and non-cpu lines are skipped; idle and iowait aren't busy"""
+    assert monitor._parse_cpu_times(STAT) == [(400, 1000), (200, 1000)]
+
+
+def test_cpu_percents_between_samples():
+    last = monitor._parse_cpu_times(STAT)
+    current = monitor._parse_cpu_times(STAT_LATER)
+    assert monitor._cpu_percents(current, last) == [75.0, 12.5]
+
+
+def test_cpu_percents_after_hotplug():
+    """A different CPU count has no comparable sample"""
+    current = monitor._parse_cpu_times(STAT)
+    assert monitor._cpu_percents(current, current[:1]) == [0.0, 0.0]
+
+
+def test_linux_collection_reaches_proc_readers():
+    """Without LibreHardwareMonitor or a C: drive, collection uses the /proc readers"""
+    if not monitor._IS_LINUX:
+        return
+
+    calls = []
+    saved = (monitor._read_net_counters, monitor._read_disk_counters, monitor._get_lhm_hardware)
+    monitor._read_net_counters = lambda: calls.append('net') or (0, 0)
+    monitor._read_disk_counters = lambda: calls.append('disk') or (0, 0)
+    monitor._get_lhm_hardware = lambda: None
+    try:
+        metrics = monitor._collect_all_metrics()
+    finally:
+        monitor._read_net_counters, monitor._read_disk_counters, monitor._get_lhm_hardware = saved
+    assert 'net' in calls and 'disk' in calls
+    assert metrics['disk_c_total'] == 0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"{name}: OK")
@@ -7,9 +7,9 @@ import os
 
 def measure_time(func, description):
     """Measure execution time of a function"""
-    start = time.time()
+    start = time.perf_counter()
     result = func()
-    elapsed = (time.time() - start) * 1000
+    elapsed = (time.perf_counter() - start) * 1000
     status = "OK"
     if elapsed > 100:
         status = "SLOW!"
@@ -23,11 +23,11 @@ print()
 
 # Step 1: Import modules
 print("Step 1: Importing modules...")
-start = time.time()
+start = time.perf_counter()
 from monitor import get_all_metrics
 from renderer import Renderer
 from device_manager import TuringDisplay
-import_time = (time.time() - start) * 1000
+import_time = (time.perf_counter() - start) * 1000
 print(f"  Import time: {import_time:.0f}ms")
 print()
 
@@ -107,10 +107,10 @@ print()
 print("Step 8: Running 10 renders to get average...")
 times = []
 for i in range(10):
-    start = time.time()
+    start = time.perf_counter()
     m = get_all_metrics()
     img = renderer.render(m)
-    elapsed = (time.time() - start) * 1000
+    elapsed = (time.perf_counter() - start) * 1000
     times.append(elapsed)
 
 avg_time = sum(times) / len(times)
@@ -4,6 +4,8 @@ Base widget class and built-in widget implementations
 """
 
 from PIL import ImageDraw, ImageFont, Image, ImageSequence, ImageOps
+from functools import lru_cache
+import math
 import os
 
 
@@ -119,32 +121,28 @@ def get_font_filename(family, bold=False, italic=False):
     return f"C:\\Windows\\Fonts\\{font_file}"
 
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
-    """Convert hex color to RGB tuple"""
+    """Convert hex color to RGB tuple (cached - layouts reuse a handful of colors)"""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
-def interpolate_color(color1, color2, factor):
+def interpolate_color(rgb1, rgb2, factor):
     """
     Interpolate between two colors
 
     Args:
-        color1: Start color (hex string)
-        color2: End color (hex string)
+        rgb1: Start color (RGB tuple, see hex_to_rgb)
+        rgb2: End color (RGB tuple)
         factor: Interpolation factor (0.0 to 1.0)
 
     Returns:
-        str: Interpolated color as hex string
+        tuple: Interpolated color as RGB tuple
     """
-    rgb1 = hex_to_rgb(color1)
-    rgb2 = hex_to_rgb(color2)
-
-    r = int(rgb1[0] + (rgb2[0] - rgb1[0]) * factor)
-    g = int(rgb1[1] + (rgb2[1] - rgb1[1]) * factor)
-    b = int(rgb1[2] + (rgb2[2] - rgb1[2]) * factor)
-
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return (int(rgb1[0] + (rgb2[0] - rgb1[0]) * factor),
+            int(rgb1[1] + (rgb2[1] - rgb1[1]) * factor),
+            int(rgb1[2] + (rgb2[2] - rgb1[2]) * factor))
 
 
 def draw_rounded_rectangle(draw, bbox, radius, fill):
@@ -190,11 +188,16 @@ def draw_gradient_rectangle(draw, bbox, start_color, end_color, radius=0, total_
     # This makes the gradient scale across the full bar, not just the filled portion
     gradient_width = total_width if total_width is not None else width
 
+    # Parse endpoint colors once instead of per column
+    rgb1 = hex_to_rgb(start_color)
+    rgb2 = hex_to_rgb(end_color)
+    span = max(gradient_width - 1, 1)
+
     # Draw gradient column by column (left to right)
     for i in range(width):
         # Calculate factor based on total gradient width, not just visible width
-        factor = i / max(gradient_width - 1, 1)
-        color = interpolate_color(start_color, end_color, factor)
+        factor = i / span
+        color = interpolate_color(rgb1, rgb2, factor)
 
         if radius > 0 and (i < radius or i >= width - radius):
             # Handle rounded corners - draw with masking
@@ -288,7 +291,6 @@ def get_needle_endpoint(center_x, center_y, angle, length):
     Returns:
         tuple: (x, y) endpoint coordinates
     """
-    import math
     rad = math.radians(angle)
     x = center_x + length * math.cos(rad)
     y = center_y + length * math.sin(rad)
@@ -417,7 +419,7 @@ class Widget:
 
         Args:
             data: Current metrics data
-            current_time: Current time.time() value
+            current_time: Current time.monotonic() value
 
         Returns:
             bool: True if widget should be re-rendered
@@ -815,8 +817,6 @@ class GaugeWidget(Widget):
         return data.get(data_source)
 
     def render(self, draw, image, data):
-        import math
-        
         # Extract position and size
         x = self.position['x']
         y = self.position['y']
@@ -1028,7 +1028,6 @@ class ImageWidget(Widget):
         full_path = self.image_path
         if not os.path.exists(full_path):
             # Check relative to layouts directory
-            import config as cfg
             full_path = os.path.join(os.path.dirname(__file__), 'layouts', self.image_path)
             
         if not os.path.exists(full_path):